@@ -0,0 +1,14 @@
+"""
+Pytest configuration for the root-level verification scripts.
+
+Puts ``src`` on the import path once, so each script collected from the
+repository root can import ``reasoning_library`` without setting up the
+path itself.
+"""
+
+import os
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
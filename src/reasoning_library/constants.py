@@ -213,6 +213,31 @@ Chosen because:
 Security impact: Prevents memory exhaustion from conversation storage attacks.
 """
 
+LOG_SANITIZATION_CACHE_SIZE = 4096
+"""
+Number of distinct log messages whose sanitized form is memoized.
+
+Chosen because:
+- Log lines repeat heavily (same templates, same error messages)
+- 4K entries covers the working set of typical services
+- Bounded LRU eviction keeps memory predictable
+
+Performance impact: Repeated messages skip the full regex pipeline.
+Security impact: Messages that may contain credentials are never cached, so
+unredacted secrets are not retained as cache keys.
+"""
+
+LOG_SANITIZATION_CACHE_MAX_INPUT = 4096
+"""
+Longest (already truncated) log message that is eligible for the cache.
+
+Chosen because:
+- Keeps worst-case cache memory near LOG_SANITIZATION_CACHE_SIZE × 4KB
+- Long, unique payloads rarely repeat and would only evict useful entries
+
+Security impact: Oversized inputs cannot be used to bloat the cache.
+"""
+
 # =============================================================================
 # CONFIDENCE CALCULATION PARAMETERS
 # =============================================================================
@@ -547,9 +547,10 @@ def _check_geometric_progression(
     validate_numeric_value(rtol, "rtol")
     validate_numeric_value(atol, "atol")
 
-    if all(s != 0 for s in sequence):
-        # Vectorized calculation using NumPy for performance optimization
-        sequence_array = np.array(sequence)
+    # Vectorized calculation using NumPy for performance optimization; the zero
+    # check runs on the array too instead of a Python-level generator
+    sequence_array = np.array(sequence)
+    if np.all(sequence_array != 0):
         ratios = sequence_array[1:] / sequence_array[:-1]
         ratios = np.clip(ratios, -1e6, 1e6)  # Single clipping operation
         if len(ratios) > 0 and np.allclose(ratios, ratios[0], rtol=rtol, atol=atol):
@@ -735,9 +736,10 @@ def find_pattern_description(
         return result_str
 
     # Check for geometric progression
-    if all(s != 0 for s in sequence):
-        # Vectorized calculation using NumPy for performance optimization
-        sequence_array = np.array(sequence)
+    # Vectorized calculation using NumPy for performance optimization; the zero
+    # check runs on the array too instead of a Python-level generator
+    sequence_array = np.array(sequence)
+    if np.all(sequence_array != 0):
         ratios = sequence_array[1:] / sequence_array[:-1]
         ratios = np.clip(ratios, -1e6, 1e6)  # Single clipping operation
         if len(ratios) > 0 and np.allclose(ratios, ratios[0], rtol = rtol, atol = atol):
@@ -1,4 +1,4 @@
-"""
+r"""
 Shared sanitization utilities for the reasoning library.
 
 This module consolidates duplicate sanitization logic from across the codebase
@@ -33,7 +33,7 @@ VULNERABILITY DETAILS:
 - VULNERABLE: sanitize_for_logging("password='secret123'") returned "password='secret123'"
 - FIXED: sanitize_for_logging("password='secret123'") now returns "password=[REDACTED]"
 - BYPASS VECTORS BLOCKED: URL encoding, HTML entities, compound strings, nested patterns
-- ENHANCED PATTERN: \b(password|api[_-]?key|token|secret|credential[s]?)\b\s*[=:]\s*[\'"]?([^\'"\s&;]+?)(?:[\'"])?(?=[\s&;,]|$)
+- ENHANCED PATTERN: \b(password|api[_-]?key|token|secret|credential[s]?)\b\s*[=:]\s*[\'"]?([^\'"\s&;][^\'"\s&;,]*)(?:[\'"])?(?=[\s&;,]|$)
 - ARCHITECTURAL FIXES: Word boundaries, proper quote handling, boundary detection
 - IMPACT: Prevents sensitive data leakage in application logs and security monitoring systems
 """
@@ -42,10 +42,12 @@ import re
 import unicodedata
 import urllib.parse
 import html
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional, Tuple
 
 from .constants import (
-    KEYWORD_LENGTH_LIMIT
+    KEYWORD_LENGTH_LIMIT,
+    LOG_SANITIZATION_CACHE_MAX_INPUT,
+    LOG_SANITIZATION_CACHE_SIZE,
 )
 from .security_logging import log_security_event, get_security_logger
 import logging
@@ -63,6 +65,14 @@ class SanitizationLevel:
     PERMISSIVE = "permissive"  # Minimal sanitization, preserves most characters
 
 
+# Single-character rewrites applied by _normalize_unicode_for_security
+_UNICODE_SECURITY_TRANSLATION = str.maketrans({
+    **dict.fromkeys(map(chr, (0x200b, 0x200c, 0x200d, 0x2060, 0xfeff))),   # Zero-width characters
+    **dict.fromkeys(map(chr, (0x2028, 0x2029)), ' '),                       # Line/paragraph separators
+    **dict.fromkeys(map(chr, (0x200e, 0x200f, *range(0x202a, 0x202f)))),   # Directional overrides
+})
+
+
 def _normalize_unicode_for_security(text: str) -> str:
     """
     SECURITY FIX: Normalize Unicode text to prevent bypass attempts.
@@ -76,10 +86,13 @@ def _normalize_unicode_for_security(text: str) -> str:
     Returns:
         Normalized text safe for security processing
     """
-    # Remove zero-width and invisible characters commonly used in bypasses
-    text = re.sub(r'[\u200b-\u200d\u2060\ufeff]', '', text)  # Zero-width characters
-    text = re.sub(r'[\u2028\u2029]', ' ', text)  # Line/paragraph separators
-    text = re.sub(r'[\u200e\u200f\u202a-\u202e]', '', text)  # Directional overrides
+    # Every character handled below is non-ASCII, and NFKC leaves ASCII unchanged
+    if text.isascii():
+        return text
+
+    # Remove zero-width and invisible characters commonly used in bypasses, and
+    # turn line/paragraph separators into spaces, in a single translate pass
+    text = text.translate(_UNICODE_SECURITY_TRANSLATION)
 
     # Normalize Unicode characters (NFKC to convert full-width to ASCII)
     text = unicodedata.normalize('NFKC', text)
@@ -87,6 +100,17 @@ def _normalize_unicode_for_security(text: str) -> str:
     return text
 
 
+def _decode_backslash_escape(match: re.Match[str]) -> str:
+    """Decode one match of a _get_backslash_escape_patterns() pattern."""
+    digits = match.group(1)
+    # Octal escapes are the only scheme with exactly three digits
+    base = 8 if len(digits) == 3 else 16
+    try:
+        return chr(int(digits, base))
+    except (ValueError, OverflowError):
+        return match.group(0)  # Leave out-of-range code points undecoded
+
+
 def _decode_encoded_characters(text: str, _recursion_depth: int = 0) -> str:
     """
     SECURITY FIX: Decode common character encodings used in bypass attempts.
@@ -110,113 +134,40 @@ def _decode_encoded_characters(text: str, _recursion_depth: int = 0) -> str:
 
     original_text = text  # Store original to check if decoding happened
 
-    try:
-        # Decode common escape patterns
-        # Handle \xNN hex escapes
-        text = re.sub(r'\\x([0-9a-fA-F]{2})', lambda m: chr(int(m.group(1), 16)), text)
-        # Handle \NNN octal escapes
-        text = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), text)
-        # Handle \\uNNNN Unicode escapes
-        text = re.sub(r'\\u([0-9a-fA-F]{4})', lambda m: chr(int(m.group(1), 16)), text)
-        # Handle \\UXXXXXXXX Unicode escapes
-        text = re.sub(r'\\U([0-9a-fA-F]{8})', lambda m: chr(int(m.group(1), 16)), text)
-    except (ValueError, OverflowError):
-        # If decoding fails, return original text
-        pass
+    # Every escape decoded here starts with a backslash; the containment check
+    # is a single C-level scan, so plain text skips the substitution pass
+    if '\\' in text:
+        try:
+            # Decode \xNN, \NNN, \\uNNNN and \\UXXXXXXXX escapes, one pass per
+            # scheme in that order, so an escape revealed by an earlier
+            # scheme is decoded by a later one in the same level
+            for escape_pattern in _get_backslash_escape_patterns():
+                text = escape_pattern.sub(_decode_backslash_escape, text)
+        except (ValueError, OverflowError):
+            # If decoding fails, return original text
+            pass
 
     # CRITICAL SECURITY FIX: After decoding, scan for newly revealed dangerous patterns
     # This prevents bypass attacks where dangerous keywords are encoded and then decoded
-    # SEC-002-CRITICALFIX: Expanded to include standalone dangerous keywords, not just with parentheses
-    dangerous_patterns = [
-        # Function call patterns (original)
-        r'eval\s*\(',
-        r'exec\s*\(',
-        r'__import__\s*\(',
-        r'chr\s*\(\s*\d+\s*\)',
-        r'getattr\s*\(',
-        r'setattr\s*\(',
-        r'hasattr\s*\(',
-        r'globals\s*\(\)',
-        r'locals\s*\(\)',
-        r'vars\s*\(\)',
-        r'dir\s*\(',
-        r'system\s*\(',
-        r'subprocess\s*\.',
-        r'open\s*\(',
-        r'file\s*\(',
-        r'compile\s*\(',
-        # SEC-002-CRITICALFIX: Standalone dangerous keywords (prevents bypass without parentheses)
-        r'\b(eval|exec|import|compile|chr|getattr|setattr|hasattr|globals|locals|vars|dir|system|open|file)\b',
-        # Additional dangerous built-ins and functions
-        r'\b(__import__|__builtins__|__name__|__file__|__package__|__doc__|__cached__)\b',
-        r'\b(reload|help|input|raw_input|exit|quit)\b',
-        r'\b(eval|exec|compile)\s*$',  # End of line dangerous keywords
-        r'^(eval|exec|compile)\b',    # Start of line dangerous keywords
-    ]
-
-    # SEC-002-CRITICALFIX: Comprehensive second-pass security analysis after full decoding
-    # This prevents sophisticated bypass attacks where multiple encoding layers are used
-
-    # First pass: Check for dangerous patterns that may have been revealed by decoding
-    for pattern in dangerous_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            # Block the entire text if dangerous patterns are found after decoding
-            # This is the safest approach to prevent encoded bypass attacks
-            return "[ENCODED_INJECTION_BLOCKED]"
-
-    # SEC-002-CRITICALFIX: Second pass - Additional comprehensive security analysis
-    # This catches bypass attempts that might slip through the first pass
-
-    # Check for concatenated dangerous strings (e.g., "ev" + "al")
-    concatenation_patterns = [
-        r'(ev|ex|im)\s*[\+]\s*(al|ec|port)',  # ev+al, ex+ec, im+port
-        r'["\'][ev]["\']\s*\+\s*["\'][al]["\']',  # 'ev'+'al'
-        r'["\'][e]["\']\s*\+\s*["\'][v]["\']\s*\+\s*["\'][a]["\']\s*\+\s*["\'][l]["\']',  # 'e'+'v'+'a'+'l'
-        r'["\']ev["\']\s*\+\s*["\']al["\']',  # 'ev'+'al' (exact)
-        r'["\']ex["\']\s*\+\s*["\']ec["\']',  # 'ex'+'ec' (exact)
-        r'["\']im["\']\s*\+\s*["\']port["\']',  # 'im'+'port' (exact)
-        # Enhanced patterns to catch more concatenation attempts
-        r'\b["\'][ev]["\']\s*\+\s*["\'][al]["\']\b',  # Word boundaries
-        r'\b["\'][ex]["\']\s*\+\s*["\'][ec]["\']\b',  # Word boundaries
-        r'\b["\'][im]["\']\s*\+\s*["\'][port]["\']\b',  # Word boundaries
-        # Check for dangerous concatenation with parentheses
-        r'["\'][ev]["\']\s*\+\s*["\'][al]["\']\s*\+\s*["\']?\(',  # 'ev'+'al'+'('
-        r'["\'][ex]["\']\s*\+\s*["\'][ec]["\']\s*\+\s*["\']?\(',  # 'ex'+'ec'+'('
-    ]
-
-    # Check for obfuscated dangerous patterns using various encoding tricks
-    obfuscation_patterns = [
-        r'(e|\\x65)\s*(v|\\x76)\s*(a|\\x61)\s*(l|\\x6c)',  # eval with hex mixing
-        r'(\\145|\\x65)\s*(\\166|\\x76)\s*(\\141|\\x61)\s*(\\154|\\x6c)',  # eval with octal/hex mixing
-        r'j\s*a\s*v\s*a\s*s\s*c\s*r\s*i\s*p\s*t',  # javascript obfuscation
-        r'd\s*o\s*c\s*u\s*m\s*e\s*n\s*t\s*\.\s*w\s*r\s*i\s*t\s*e',  # document.write obfuscation
-    ]
-
-    # Check all additional patterns
-    all_additional_patterns = concatenation_patterns + obfuscation_patterns
-
-    for pattern in all_additional_patterns:
-        if re.search(pattern, text, re.IGNORECASE | re.VERBOSE):
-            # Block if any obfuscation or concatenation patterns are found
-            return "[ENCODED_INJECTION_BLOCKED]"
+    # SEC-002-CRITICALFIX: Dangerous keywords, concatenation and obfuscation attempts
+    # are checked together by one fused pattern, so the text is scanned once
+    if _get_decoded_injection_pattern().search(text):
+        # Block the entire text if dangerous patterns are found after decoding
+        # This is the safest approach to prevent encoded bypass attacks
+        return "[ENCODED_INJECTION_BLOCKED]"
+
+    # Each remaining escape needs a backslash, '%' or '&'; without any of them
+    # none of the patterns below can match
+    if '\\' not in text and '%' not in text and '&' not in text:
+        return text
 
     # SEC-002-CRITICALFIX: Third pass - Check for nested encoding attempts
     # Sometimes attackers encode multiple times to bypass simple detection
     # Look for remaining escape sequences that might indicate multi-layer encoding
-    remaining_escape_patterns = [
-        r'\\x[0-9a-fA-F]{2}',      # Hex escapes
-        r'\\[0-7]{3}',             # Octal escapes
-        r'\\u[0-9a-fA-F]{4}',      # Unicode escapes
-        r'\\U[0-9a-fA-F]{8}',      # Long Unicode escapes
-        r'%[0-9a-fA-F]{2}',        # Percent encoding
-        r'&#[0-9]+;',              # HTML decimal entities
-        r'&#[xX][0-9a-fA-F]+;',    # HTML hex entities
-    ]
-
     # If we find remaining escape patterns, recursively decode and check again
     # This prevents multi-layer encoding bypasses
-    for pattern in remaining_escape_patterns:
-        if re.search(pattern, text):
+    for search in _get_remaining_escape_searches():
+        if search(text):
             # Recursively decode again to catch multi-layer encoding
             redecoded_text = _decode_encoded_characters(text, _recursion_depth + 1)
             if redecoded_text != text:  # If more decoding happened
@@ -250,6 +201,11 @@ def _enhanced_preprocessing_for_bypass_prevention(text: str) -> str:
     if not isinstance(text, str):
         return ""
 
+    # Both decoders below only act on a '%' or '&' introducer; clean text,
+    # which is most log traffic, is returned unchanged without calling them
+    if '%' not in text and '&' not in text:
+        return text
+
     try:
         # Step 1: URL decoding - prevents pass%77ord type bypasses
         # This handles percent-encoded characters that could mask sensitive field names
@@ -268,7 +224,9 @@ def _enhanced_preprocessing_for_bypass_prevention(text: str) -> str:
             except (ValueError, OverflowError):
                 return match.group(0)  # Return original if decoding fails
 
-        text = re.sub(r'%([0-9a-fA-F]{2})', hex_decoder, text)
+        # Skipped outright when no percent sign survived the URL decoding
+        if '%' in text:
+            text = re.sub(r'%([0-9a-fA-F]{2})', hex_decoder, text)
 
     except Exception:
         # If any decoding fails, continue with original text
@@ -506,12 +464,243 @@ def _get_sensitive_data_pattern() -> re.Pattern:
     - Stops at &, space, comma, semicolon boundaries to handle compound strings
     - Enhanced to handle nested quotes and complex value patterns
     - Improved quote handling to properly strip surrounding quotes
+    - Value is matched greedily up to an explicit terminator class instead of a
+      lazy quantifier that re-tests the lookahead after every character
     """
     return re.compile(
-        r'\b(password|api[_-]?key|token|secret|credential[s]?)\b\s*[=:]\s*[\'"]?([^\'"\s&;]+?)(?:[\'"])?(?=[\s&;,]|$)',
+        r'\b(password|api[_-]?key|token|secret|credential[s]?)\b\s*[=:]\s*[\'"]?([^\'"\s&;][^\'"\s&;,]*)(?:[\'"])?(?=[\s&;,]|$)',
         re.IGNORECASE
     )
 
+# Substrings every sensitive field name contains once case-folded. 'credent' stops
+# short of the 'i' because re.IGNORECASE also matches dotted/dotless I variants
+# that casefold() maps elsewhere; every other letter folds exactly as re matches it.
+_SENSITIVE_FIELD_NEEDLES = ('password', 'key', 'token', 'secret', 'credent')
+
+
+def _may_contain_sensitive_data(text: str) -> bool:
+    """
+    Cheap prefilter for _get_sensitive_data_pattern().
+
+    Plain substring checks are fixed-string scans, so messages without a '='/':'
+    separator or without any credential field name skip the regex entirely. The
+    separator check needs no case folding and runs first. Returns False only
+    when the sensitive data pattern cannot match.
+    """
+    if '=' not in text and ':' not in text:
+        return False
+    folded = text.casefold()
+    return any(needle in folded for needle in _SENSITIVE_FIELD_NEEDLES)
+
+@lru_cache(maxsize=None)
+def _get_backslash_escape_patterns() -> Tuple[re.Pattern[str], ...]:
+    """
+    Get the escape patterns decoded by _decode_encoded_characters, in pass order.
+
+    Each pattern captures the escape's digits and gets its own substitution
+    pass. Sequential passes unwrap nested mixed escapes (e.g. \\x5c followed
+    by u0041) within a single recursion level, which one fused pass cannot.
+    """
+    return (
+        re.compile(r'\\x([0-9a-fA-F]{2})'),   # \xNN hex escapes
+        re.compile(r'\\([0-7]{3})'),          # \NNN octal escapes
+        re.compile(r'\\u([0-9a-fA-F]{4})'),   # \\uNNNN Unicode escapes
+        re.compile(r'\\U([0-9a-fA-F]{8})'),   # \\UXXXXXXXX Unicode escapes
+    )
+
+@lru_cache(maxsize=None)
+def _get_remaining_escape_searches() -> Tuple[Callable[[str], Optional[re.Match[str]]], ...]:
+    """
+    Get bound search methods for escapes that survive one decoding pass.
+
+    _decode_encoded_characters recurses whenever one of these matches, so the
+    patterns are compiled once and their ``search`` methods reused.
+    """
+    return tuple(re.compile(source).search for source in (
+        r'\\x[0-9a-fA-F]{2}',      # Hex escapes
+        r'\\[0-7]{3}',             # Octal escapes
+        r'\\u[0-9a-fA-F]{4}',      # Unicode escapes
+        r'\\U[0-9a-fA-F]{8}',      # Long Unicode escapes
+        r'%[0-9a-fA-F]{2}',        # Percent encoding
+        r'&#[0-9]+;',              # HTML decimal entities
+        r'&#[xX][0-9a-fA-F]+;',    # HTML hex entities
+    ))
+
+@lru_cache(maxsize=None)
+def _get_suspicious_input_searches() -> Tuple[Callable[[str], Optional[re.Match[str]]], ...]:
+    """
+    Get bound search methods for the MAJOR-006 pre-sanitization audit check.
+
+    sanitize_text_input runs these over the lowercased input on every call to
+    decide whether to emit a security event.
+    """
+    return tuple(re.compile(source).search for source in (
+        r'eval\s*\(', r'exec\s*\(', r'__import__\s*\(',  # Code injection
+        r'\bdrop\s+table\b', r';\s*drop',  # SQL injection
+        r'<script[^>]*>', r'javascript:',  # XSS
+        r'\.\./', r'%2e%2e%2f',  # Path traversal
+    ))
+
+# Patterns that _decode_encoded_characters blocks once decoding has run
+# SEC-002-CRITICALFIX: Expanded to include standalone dangerous keywords, not just with parentheses
+_DECODED_DANGEROUS_SOURCES = (
+    # Function call patterns (original)
+    r'eval\s*\(',
+    r'exec\s*\(',
+    r'__import__\s*\(',
+    r'chr\s*\(\s*\d+\s*\)',
+    r'getattr\s*\(',
+    r'setattr\s*\(',
+    r'hasattr\s*\(',
+    r'globals\s*\(\)',
+    r'locals\s*\(\)',
+    r'vars\s*\(\)',
+    r'dir\s*\(',
+    r'system\s*\(',
+    r'subprocess\s*\.',
+    r'open\s*\(',
+    r'file\s*\(',
+    r'compile\s*\(',
+    # SEC-002-CRITICALFIX: Standalone dangerous keywords (prevents bypass without parentheses)
+    r'\b(eval|exec|import|compile|chr|getattr|setattr|hasattr|globals|locals|vars|dir|system|open|file)\b',
+    # Additional dangerous built-ins and functions
+    r'\b(__import__|__builtins__|__name__|__file__|__package__|__doc__|__cached__)\b',
+    r'\b(reload|help|input|raw_input|exit|quit)\b',
+    r'\b(eval|exec|compile)\s*$',  # End of line dangerous keywords
+    r'^(eval|exec|compile)\b',    # Start of line dangerous keywords
+)
+
+# Concatenated dangerous strings (e.g., "ev" + "al")
+_DECODED_CONCATENATION_SOURCES = (
+    r'(ev|ex|im)\s*[\+]\s*(al|ec|port)',  # ev+al, ex+ec, im+port
+    r'["\'][ev]["\']\s*\+\s*["\'][al]["\']',  # 'ev'+'al'
+    r'["\'][e]["\']\s*\+\s*["\'][v]["\']\s*\+\s*["\'][a]["\']\s*\+\s*["\'][l]["\']',  # 'e'+'v'+'a'+'l'
+    r'["\']ev["\']\s*\+\s*["\']al["\']',  # 'ev'+'al' (exact)
+    r'["\']ex["\']\s*\+\s*["\']ec["\']',  # 'ex'+'ec' (exact)
+    r'["\']im["\']\s*\+\s*["\']port["\']',  # 'im'+'port' (exact)
+    # Enhanced patterns to catch more concatenation attempts
+    r'\b["\'][ev]["\']\s*\+\s*["\'][al]["\']\b',  # Word boundaries
+    r'\b["\'][ex]["\']\s*\+\s*["\'][ec]["\']\b',  # Word boundaries
+    r'\b["\'][im]["\']\s*\+\s*["\'][port]["\']\b',  # Word boundaries
+    # Check for dangerous concatenation with parentheses
+    r'["\'][ev]["\']\s*\+\s*["\'][al]["\']\s*\+\s*["\']?\(',  # 'ev'+'al'+'('
+    r'["\'][ex]["\']\s*\+\s*["\'][ec]["\']\s*\+\s*["\']?\(',  # 'ex'+'ec'+'('
+)
+
+# Obfuscated dangerous patterns using various encoding tricks
+_DECODED_OBFUSCATION_SOURCES = (
+    r'(e|\\x65)\s*(v|\\x76)\s*(a|\\x61)\s*(l|\\x6c)',  # eval with hex mixing
+    r'(\\145|\\x65)\s*(\\166|\\x76)\s*(\\141|\\x61)\s*(\\154|\\x6c)',  # eval with octal/hex mixing
+    r'j\s*a\s*v\s*a\s*s\s*c\s*r\s*i\s*p\s*t',  # javascript obfuscation
+    r'd\s*o\s*c\s*u\s*m\s*e\s*n\s*t\s*\.\s*w\s*r\s*i\s*t\s*e',  # document.write obfuscation
+)
+
+# Concatenation bypass attempts such as 'ev' + 'al' that sanitize_for_concatenation
+# blocks outright, in addition to the keyword/template/nested detectors
+_CONCATENATION_BYPASS_SOURCES = (
+    # Direct string concatenation attempts
+    r"['\"]ev['\"]\s*\+\s*['\"]al['\"]",
+    r"['\"]ex['\"]\s*\+\s*['\"]ec['\"]",
+    r"['\"]im['\"]\s*\+\s*['\"]port['\"]",
+    # With parentheses
+    r"['\"]ev['\"]\s*\+\s*['\"]al['\"]\s*\+\s*['\"]?\(",
+    r"['\"]ex['\"]\s*\+\s*['\"]ec['\"]\s*\+\s*['\"]?\(",
+    # More complex concatenation
+    r"['\"]e['\"]\s*\+\s*['\"]v['\"]\s*\+\s*['\"]a['\"]\s*\+\s*['\"]l['\"]",
+)
+
+# Extra log injection markers checked alongside _get_log_injection_pattern()
+_LOG_INJECTION_DETECTOR_SOURCES = (
+    ("timestamp", r'\d{4}-\d{1,2}-\d{1,2}\s+\d{1,2}:\d{2}:\d{2}[,\s]'),  # Timestamps
+    ("syslog_timestamp", r'\w+\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}'),  # Syslog timestamps
+    ("process_id", r'\[pid\s+\d+\]'),  # Process ID injection
+    ("thread_id", r'\[tid\s+\d+\]'),  # Thread ID injection
+    ("email", r'<\w+@[^>]+>'),  # Email address injection
+    ("url", r'://[^/\s]+'),  # URL injection that could look like log sources
+)
+
+
+# Marker written by sanitize_for_logging for each group of _get_log_metadata_pattern()
+_LOG_METADATA_MARKERS = {
+    "timestamp": "[TIMESTAMP_BLOCKED]",
+    "process_info": "[PROCESS_INFO_BLOCKED]",
+}
+
+
+def _log_metadata_marker(match: re.Match[str]) -> str:
+    """Return the block marker for a _get_log_metadata_pattern() match."""
+    group = match.lastgroup
+    if group is None:  # every alternative is a named group, so this is unreachable
+        return match.group(0)
+    return _LOG_METADATA_MARKERS[group]
+
+@lru_cache(maxsize=None)
+def _get_log_metadata_pattern() -> re.Pattern[str]:
+    """
+    Get the fused timestamp and process info pattern blocked in log messages.
+
+    Group names key into _LOG_METADATA_MARKERS, so a single sub() with
+    _log_metadata_marker replaces both kinds of injected log metadata.
+    """
+    return re.compile(
+        r'(?P<timestamp>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})|'
+        r'(?P<process_info>\[pid\s+\d+\]|\[tid\s+\d+\])'
+    )
+
+def _combine_named_patterns(named_sources: Iterable[Tuple[str, str]]) -> re.Pattern[str]:
+    """Fuse (name, source) pairs into one case-insensitive alternation of named groups."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{source})" for name, source in named_sources),
+        re.IGNORECASE
+    )
+
+@lru_cache(maxsize=None)
+def _get_decoded_injection_pattern() -> re.Pattern[str]:
+    """
+    Get the fused post-decoding detector used by _decode_encoded_characters.
+
+    Combines the dangerous keyword, concatenation and obfuscation checks that
+    previously ran as separate searches into one alternation.
+    """
+    sources = (
+        _DECODED_DANGEROUS_SOURCES
+        + _DECODED_CONCATENATION_SOURCES
+        + _DECODED_OBFUSCATION_SOURCES
+    )
+    return re.compile("|".join(f"(?:{source})" for source in sources), re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _get_concatenation_injection_pattern() -> re.Pattern[str]:
+    """
+    Get the fused injection detector used by sanitize_for_concatenation.
+
+    Combines the dangerous keyword, template injection, nested injection and
+    concatenation bypass detectors so one scan decides whether to block;
+    ``match.lastgroup`` names the detector that fired.
+    """
+    named_sources = [
+        ("dangerous_keyword", _get_dangerous_keyword_pattern().pattern),
+        ("template_injection", _get_template_injection_pattern().pattern),
+        ("nested_injection", _get_nested_injection_pattern().pattern),
+    ]
+    named_sources.extend(
+        (f"concatenation_bypass_{index}", source)
+        for index, source in enumerate(_CONCATENATION_BYPASS_SOURCES)
+    )
+    return _combine_named_patterns(named_sources)
+
+@lru_cache(maxsize=None)
+def _get_log_injection_detector_pattern() -> re.Pattern[str]:
+    """
+    Get the fused log injection detector used by sanitize_for_logging.
+
+    Combines _get_log_injection_pattern() with the additional timestamp, process,
+    email and URL markers so detection takes a single scan of the message.
+    """
+    return _combine_named_patterns(
+        (("log_injection", _get_log_injection_pattern().pattern),) + _LOG_INJECTION_DETECTOR_SOURCES
+    )
+
 # Backward compatibility aliases (deprecated - use _get_*_pattern() functions instead)
 # These maintain compatibility while new code should use the getter functions
 # Note: Regex patterns are now lazily loaded through module-level __getattr__ function
@@ -567,12 +756,8 @@ def sanitize_text_input(
     original_text = text  # Store for security logging
 
     # MAJOR-006: Security logging - Check for suspicious patterns before processing
-    if any(pattern.search(text.lower()) for pattern_list in [
-        [r'eval\s*\(', r'exec\s*\(', r'__import__\s*\('],  # Code injection
-        [r'\bdrop\s+table\b', r';\s*drop'],  # SQL injection
-        [r'<script[^>]*>', r'javascript:'],  # XSS
-        [r'\.\./', r'%2e%2e%2f'],  # Path traversal
-    ] for pattern in [re.compile(p) for p in pattern_list]):
+    lowered_text = text.lower()
+    if any(search(lowered_text) for search in _get_suspicious_input_searches()):
         # Log security event
         log_security_event(
             input_text=text,
@@ -625,7 +810,7 @@ def sanitize_text_input(
         text = _get_string_concatenation_pattern().sub(' ', text)
 
         # SECURITY FIX: Remove dots after code blocking to prevent bypass
-        text = re.sub(r'[.]', ' ', text)  # Remove all remaining dots
+        text = text.replace('.', ' ')  # Remove all remaining dots
         text = _get_dunder_pattern().sub('', text)
         text = _get_attribute_pattern().sub('', text)
         text = _get_shell_pattern().sub('', text)
@@ -722,7 +907,7 @@ def sanitize_for_concatenation(text: Any, max_length: int = 50, source: str = "u
 
     # SEC-002-CRITICALFIX: Check for dangerous content after preprocessing
     # This catches sensitive data patterns that should be blocked entirely
-    if _get_sensitive_data_pattern().search(text):
+    if _may_contain_sensitive_data(text) and _get_sensitive_data_pattern().search(text):
         # Log security event for sensitive data in concatenation
         log_security_event(
             input_text=text[:100],  # Limit length for security logs
@@ -737,30 +922,8 @@ def sanitize_for_concatenation(text: Any, max_length: int = 50, source: str = "u
         return ""  # Block entirely - no sensitive data should be concatenated
 
     # SEC-002-CRITICALFIX: Check for injection patterns early
-    # Include concatenation bypass patterns
-    dangerous_patterns = [
-        _get_dangerous_keyword_pattern(),
-        _get_template_injection_pattern(),
-        _get_nested_injection_pattern(),
-    ]
-
-    # Add concatenation bypass patterns directly
-    concatenation_bypass_patterns = [
-        # Direct string concatenation attempts
-        r"['\"]ev['\"]\s*\+\s*['\"]al['\"]",
-        r"['\"]ex['\"]\s*\+\s*['\"]ec['\"]",
-        r"['\"]im['\"]\s*\+\s*['\"]port['\"]",
-        # With parentheses
-        r"['\"]ev['\"]\s*\+\s*['\"]al['\"]\s*\+\s*['\"]?\(",
-        r"['\"]ex['\"]\s*\+\s*['\"]ec['\"]\s*\+\s*['\"]?\(",
-        # More complex concatenation
-        r"['\"]e['\"]\s*\+\s*['\"]v['\"]\s*\+\s*['\"]a['\"]\s*\+\s*['\"]l['\"]",
-    ]
-
-    for pattern in concatenation_bypass_patterns:
-        dangerous_patterns.append(re.compile(pattern, re.IGNORECASE))
-
-    if any(pattern.search(text) for pattern in dangerous_patterns):
+    # Keyword, template, nested and concatenation bypass detectors share one scan
+    if _get_concatenation_injection_pattern().search(text):
         # Log security event for injection attempt
         log_security_event(
             input_text=text[:100],  # Limit length for security logs
@@ -832,6 +995,79 @@ def sanitize_for_display(text: Any, max_length: Optional[int] = None, source: st
     )
 
 
+def _sanitize_log_message(text: str) -> Tuple[str, bool]:
+    """
+    Apply the sanitize_for_logging transformations to an already truncated message.
+
+    Args:
+        text: Message text, already limited to the caller's max_length
+
+    Returns:
+        Tuple[str, bool]: The sanitized (unstripped) text and whether a log
+        injection attempt was detected
+    """
+    # SECURITY FIX: Preprocess to prevent bypass attempts
+    text = _normalize_unicode_for_security(text)
+    text = _decode_encoded_characters(text)
+
+    # SEC-001-ARCHFIX: Enhanced pre-processing to prevent encoding bypasses
+    # This prevents URL encoding, HTML entity encoding, and other sophisticated bypasses
+    text = _enhanced_preprocessing_for_bypass_prevention(text)
+
+    # SEC-001: CRITICAL FIX - Mask sensitive data BEFORE any other processing
+    # This prevents passwords, API keys, tokens, secrets, and credentials from being logged
+    def _mask_sensitive_data(match):
+        """Replace sensitive data with [REDACTED] marker."""
+        field_name = match.group(1)  # The field name (password, api_key, etc.)
+        return f"{field_name}=[REDACTED]"
+
+    if _may_contain_sensitive_data(text):
+        text = _get_sensitive_data_pattern().sub(_mask_sensitive_data, text)
+
+    # ID-003: Enhanced log injection detection; the log injection pattern and the
+    # additional timestamp/process/email/URL markers are checked in a single scan
+    injection_detected = _get_log_injection_detector_pattern().search(text) is not None
+
+    # ID-003: Comprehensive log sanitization
+    text = _get_control_char_pattern().sub(' ', text)
+    text = _get_ansi_escape_pattern().sub('[ANSI_BLOCKED]', text)
+    text = _get_whitespace_pattern().sub(' ', text)
+
+    # Enhanced log injection protection with clear marking
+    text = _get_log_injection_pattern().sub('[LOG_INJECTION_BLOCKED]', text)
+
+    # Block additional suspicious patterns; timestamps and process info share
+    # one substitution pass, with the marker chosen by the matching group
+    text = _get_log_metadata_pattern().sub(_log_metadata_marker, text)
+
+    return text, injection_detected
+
+
+# Memoized _sanitize_log_message; the function has no side effects, so caching
+# it cannot suppress the security events emitted by sanitize_for_logging
+_sanitize_log_message_cached = lru_cache(maxsize=LOG_SANITIZATION_CACHE_SIZE)(_sanitize_log_message)
+
+
+def _is_log_message_cacheable(text: str) -> bool:
+    """
+    Whether a message may be kept as a _sanitize_log_message_cached key.
+
+    Cache keys are the raw messages, so anything that could hold a credential
+    is never cached; unredacted secrets would otherwise stay in memory. Only
+    ASCII text without '%', '&' or backslashes is eligible, because the Unicode
+    and decoding preprocessing cannot reveal a field name or separator in it,
+    so the sensitive data prefilter on the raw text is conclusive.
+    """
+    return (
+        len(text) <= LOG_SANITIZATION_CACHE_MAX_INPUT
+        and text.isascii()
+        and '%' not in text
+        and '&' not in text
+        and '\\' not in text
+        and not _may_contain_sensitive_data(text)
+    )
+
+
 def sanitize_for_logging(text: Any, max_length: Optional[int] = None, source: str = "unknown") -> str:
     """
     ID-003 SECURITY FIX: Enhanced sanitization for text that will be written to logs.
@@ -889,56 +1125,12 @@ def sanitize_for_logging(text: Any, max_length: Optional[int] = None, source: st
     original_text = text  # Store for security logging
     text = text[:max_length]
 
-    # SECURITY FIX: Preprocess to prevent bypass attempts
-    text = _normalize_unicode_for_security(text)
-    text = _decode_encoded_characters(text)
-
-    # SEC-001-ARCHFIX: Enhanced pre-processing to prevent encoding bypasses
-    # This prevents URL encoding, HTML entity encoding, and other sophisticated bypasses
-    text = _enhanced_preprocessing_for_bypass_prevention(text)
-
-    # SEC-001: CRITICAL FIX - Mask sensitive data BEFORE any other processing
-    # This prevents passwords, API keys, tokens, secrets, and credentials from being logged
-    def _mask_sensitive_data(match):
-        """Replace sensitive data with [REDACTED] marker."""
-        field_name = match.group(1)  # The field name (password, api_key, etc.)
-        return f"{field_name}=[REDACTED]"
-
-    text = _get_sensitive_data_pattern().sub(_mask_sensitive_data, text)
-
-    # ID-003: Enhanced log injection detection with multiple passes
-    injection_detected = False
-
-    # First pass: Detect log injection patterns
-    if _get_log_injection_pattern().search(text):
-        injection_detected = True
-
-    # Second pass: Additional log injection detection patterns
-    additional_patterns = [
-        r'\d{4}-\d{1,2}-\d{1,2}\s+\d{1,2}:\d{2}:\d{2}[,\s]',  # Timestamps
-        r'\w+\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}',  # Syslog timestamps
-        r'\[pid\s+\d+\]',  # Process ID injection
-        r'\[tid\s+\d+\]',  # Thread ID injection
-        r'<\w+@[^>]+>',  # Email address injection
-        r'://[^/\s]+',  # URL injection that could look like log sources
-    ]
-
-    for pattern in additional_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            injection_detected = True
-            break
-
-    # ID-003: Comprehensive log sanitization
-    text = _get_control_char_pattern().sub(' ', text)
-    text = _get_ansi_escape_pattern().sub('[ANSI_BLOCKED]', text)
-    text = _get_whitespace_pattern().sub(' ', text)
-
-    # Enhanced log injection protection with clear marking
-    text = _get_log_injection_pattern().sub('[LOG_INJECTION_BLOCKED]', text)
-
-    # Block additional suspicious patterns
-    text = re.sub(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', '[TIMESTAMP_BLOCKED]', text)
-    text = re.sub(r'\[pid\s+\d+\]|\[tid\s+\d+\]', '[PROCESS_INFO_BLOCKED]', text)
+    # The message transformation is pure, so repeated messages come from an LRU
+    # cache; security logging below still runs on every call
+    if _is_log_message_cacheable(text):
+        text, injection_detected = _sanitize_log_message_cached(text)
+    else:
+        text, injection_detected = _sanitize_log_message(text)
 
     # ID-003: Security logging for injection attempts
     if injection_detected and len(original_text.strip()) > 0:
@@ -1307,16 +1499,12 @@ class SecureLogger:
             # Sanitize the main message
             sanitized_msg = sanitize_for_logging(msg, source=source)
 
-            # Sanitize all arguments
-            sanitized_args = []
-            for arg in args:
-                if isinstance(arg, str):
-                    sanitized_arg = sanitize_for_logging(arg, source=source)
-                    sanitized_args.append(sanitized_arg)
-                else:
-                    # For non-string args, convert to string and sanitize
-                    sanitized_arg = sanitize_for_logging(str(arg), source=source)
-                    sanitized_args.append(sanitized_arg)
+            # Sanitize all arguments; non-string args are converted to string first.
+            # The comprehension avoids a per-argument append lookup and call
+            sanitized_args = [
+                sanitize_for_logging(arg if isinstance(arg, str) else str(arg), source=source)
+                for arg in args
+            ]
 
             # Log the sanitized message and arguments
             getattr(self._logger, level)(sanitized_msg, *sanitized_args, **kwargs)
@@ -21,6 +21,7 @@ import time
 import json
 import re
 import threading
+from collections import Counter
 from typing import Dict, Any, Optional, List, Set
 from datetime import datetime, timezone
 from enum import Enum
@@ -76,6 +77,11 @@ class SecurityLogger:
         # Event correlation
         self._event_patterns: Dict[str, Dict[str, Any]] = {}
 
+        # Running per-type totals, kept alongside the correlation data so
+        # metrics don't have to re-sum every source on each snapshot
+        self._event_counts: Counter[str] = Counter()
+        self._event_total = 0
+
         # Sensitive patterns to mask in logs
         self._sensitive_patterns = [
             r'password[=:]\s*[\'\"]?([^\'\"\s]+)',
@@ -335,40 +341,53 @@ class SecurityLogger:
             # Update statistics
             stats = self._event_patterns[event_type][source]
             stats["count"] += 1
+            self._event_counts[event_type] += 1
+            self._event_total += 1
             stats["last_seen"] = log_entry["timestamp"]
             stats["severity_levels"].add(log_entry["severity"])
 
+    @property
+    def event_counter(self) -> int:
+        """Total number of recorded security events; same as metrics total_events."""
+        return self._event_total
+
     def get_security_metrics(self) -> Dict[str, Any]:
         """Get security metrics for monitoring and reporting."""
-        with self._lock:
-            total_events = sum(
-                source_stats["count"]
-                for event_type in self._event_patterns.values()
-                for source_stats in event_type.values()
-            )
+        return self.snapshot_into({})
+
+    def snapshot_into(self, out: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write current security metrics into a caller-provided dict.
+
+        Lets monitoring loops reuse one dict instead of allocating a new
+        snapshot on every poll.
 
-            events_by_type = {
-                event_type: sum(source_stats["count"] for source_stats in sources.values())
-                for event_type, sources in self._event_patterns.items()
-            }
+        Args:
+            out: Dict to populate; existing metric keys are overwritten
+
+        Returns:
+            The same dict passed in as ``out``
+        """
+        with self._lock:
+            total_events = self._event_total
+            events_by_type = dict(self._event_counts)
 
             active_sources = set()
             for sources in self._event_patterns.values():
                 active_sources.update(sources.keys())
 
-            return {
-                "total_events": total_events,
-                "events_by_type": events_by_type,
-                "active_sources": len(active_sources),
-                "rate_limited_sources": len(self._rate_limit_tracker),
-                "correlation_patterns": len(self._event_patterns),
-                "last_activity": max(
-                    (source_stats["last_seen"]
-                     for sources in self._event_patterns.values()
-                     for source_stats in sources.values()),
-                    default=None
-                )
-            }
+            out["total_events"] = total_events
+            out["events_by_type"] = events_by_type
+            out["active_sources"] = len(active_sources)
+            out["rate_limited_sources"] = len(self._rate_limit_tracker)
+            out["correlation_patterns"] = len(self._event_patterns)
+            out["last_activity"] = max(
+                (source_stats["last_seen"]
+                 for sources in self._event_patterns.values()
+                 for source_stats in sources.values()),
+                default=None
+            )
+            return out
 
     @contextmanager
     def security_context(self, source: str = "unknown"):
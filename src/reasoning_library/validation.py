@@ -7,6 +7,7 @@ type-related security vulnerabilities.
 """
 
 import inspect
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Union, TypedDict
 
 import numpy as np
@@ -18,6 +19,34 @@ import re
 from .exceptions import ValidationError
 
 
+# LAZY LOADING: Confidence-string patterns are compiled on first use. The
+# dangerous notations are fused into one alternation so each input is scanned
+# once instead of once per notation.
+
+@lru_cache(maxsize=None)
+def _get_dangerous_confidence_pattern() -> re.Pattern[str]:
+    """Get the fused pattern for numeric notations rejected in confidence strings."""
+    dangerous_patterns = (
+        r'[nN][aA][nN]',                # nan, NaN, NAN
+        r'-?[iI][nN][fF]',              # inf, Inf, INF, -inf
+        r'[+-]?\d*[eE][+-]?\d+',        # scientific notation like 1e10, 1e-10
+        r'0[xX][0-9a-fA-F]+',           # hexadecimal notation
+        r'0[bB][01]+',                  # binary notation
+        r'0[oO][0-7]+',                 # octal notation
+    )
+    return re.compile('|'.join(dangerous_patterns))
+
+@lru_cache(maxsize=None)
+def _get_invalid_confidence_char_pattern() -> re.Pattern[str]:
+    """Get the pattern for characters not allowed in a confidence string."""
+    return re.compile(r'[^\d.\-+]')
+
+@lru_cache(maxsize=None)
+def _get_decimal_confidence_pattern() -> re.Pattern[str]:
+    """Get the strict decimal format pattern for confidence strings."""
+    return re.compile(r'[+-]?(\d+(\.\d*)?|\.\d+)')
+
+
 # TypedDict definitions for type-safe data structures
 class Hypothesis(TypedDict, total=False):
     """Type-safe representation of a hypothesis with confidence scoring."""
@@ -238,6 +267,13 @@ def validate_confidence_value(confidence: Union[int, float, str, None]) -> float
     Raises:
         ValidationError: If confidence is not numeric or contains dangerous values
     """
+    # FAST PATH: a float/int already in range needs no further checks.
+    # NaN fails the range comparison and falls through to the checks below;
+    # adding 0.0 normalizes -0.0 to 0.0 as the clamp below does.
+    if isinstance(confidence, (int, float)) and not isinstance(confidence, bool):
+        if 0.0 <= confidence <= 1.0:
+            return float(confidence) + 0.0
+
     # Handle None
     if confidence is None:
         raise ValidationError("Confidence value cannot be None")
@@ -272,36 +308,21 @@ def _validate_string_confidence(confidence_str: str) -> float:
     Raises:
         ValidationError: If string contains invalid or dangerous content
     """
-    import re
-
     # Remove whitespace but check for empty/whitespace-only strings
     trimmed = confidence_str.strip()
     if not trimmed:
         raise ValidationError("Confidence value cannot be empty or whitespace-only")
 
     # Check for dangerous patterns that could cause type coercion issues
-    dangerous_patterns = [
-        r'^[nN][aA][nN]$',                    # nan, NaN, NAN
-        r'^[iI][nN][fF]$',                    # inf, Inf, INF
-        r'^-[iI][nN][fF]$',                   # -inf, -Inf
-        r'^[+-]?\d*[eE][+-]?\d+$',            # scientific notation like 1e10, 1e-10
-        r'^0[xX][0-9a-fA-F]+$',               # hexadecimal notation
-        r'^0[bB][01]+$',                      # binary notation
-        r'^0[oO][0-7]+$',                     # octal notation
-    ]
-
-    # Check for dangerous content in the string
-    for pattern in dangerous_patterns:
-        if re.match(pattern, trimmed):
-            raise ValidationError(f"Confidence value '{confidence_str}' contains invalid format or dangerous content")
+    if _get_dangerous_confidence_pattern().fullmatch(trimmed):
+        raise ValidationError(f"Confidence value '{confidence_str}' contains invalid format or dangerous content")
 
     # Check for invalid characters (anything except digits, decimal point, and leading sign)
-    if re.search(r'[^\d.\-+]', trimmed):
+    if _get_invalid_confidence_char_pattern().search(trimmed):
         raise ValidationError(f"Confidence value '{confidence_str}' contains invalid characters")
 
     # Strict decimal format validation: optional sign, digits, optional decimal point and more digits
-    decimal_pattern = r'^[+-]?(\d+(\.\d*)?|\.\d+)$'
-    if not re.match(decimal_pattern, trimmed):
+    if not _get_decimal_confidence_pattern().fullmatch(trimmed):
         raise ValidationError(f"Confidence value '{confidence_str}' must be a valid decimal number")
 
     try:
@@ -322,6 +343,37 @@ def _validate_string_confidence(confidence_str: str) -> float:
         raise ValidationError(f"Confidence value '{confidence_str}' cannot be converted to a valid number: {e}")
 
 
+def validate_confidence_value_batch(
+    values: List[Union[int, float, str, None]]
+) -> List[Union[float, ValidationError]]:
+    """
+    Validate many confidence values in one call.
+
+    Failures do not stop the batch: each invalid value yields the
+    ValidationError it raised in place of a result.
+
+    Args:
+        values: The confidence values to validate
+
+    Returns:
+        List[Union[float, ValidationError]]: One entry per input, in order
+
+    Raises:
+        ValidationError: If values is not a list or tuple
+    """
+    if not isinstance(values, (list, tuple)):
+        raise ValidationError(f"Confidence values must be a list, got {type(values).__name__}")
+
+    validate = validate_confidence_value
+    results: List[Union[float, ValidationError]] = []
+    for value in values:
+        try:
+            results.append(validate(value))
+        except ValidationError as e:
+            results.append(e)
+    return results
+
+
 def validate_hypotheses_list(
     hypotheses: Optional[List[Dict[str, Any]]],
     field_name: str,
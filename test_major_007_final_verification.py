@@ -4,26 +4,109 @@ MAJOR-007: Final Comprehensive Security Verification
 This test performs a final verification that all security fixes are properly implemented.
 """
 
+import functools
 import sys
 import os
 import re
+from collections import Counter
+
+# Banner lines, built once at import
+_BAR60 = "=" * 60
+_BAR70 = "=" * 70
+_RULE40 = "-" * 40
+_RULE50 = "-" * 50
+
+# Literal markers looked for in validation.py. They are matched together in
+# a single regex pass instead of one substring scan per marker.
+_VALIDATION_NEEDLES = (
+    'from .security_logging import get_security_logger',
+    'security_logger.log_security_event',
+    'log_security_event',
+    'SecurityError',
+    'block_action=True',
+    'except ValidationError:',
+    'except (ValueError, TypeError):',
+    'except SecurityError:',
+    'except Exception as e:',
+    '"Invalid input type provided"',
+    '"Invalid input provided"',
+    '"Security violation detected"',
+    '"Invalid input"',
+    'dangerous_patterns',
+    'jndi:',
+    'return default_value',
+)
+
+# Longest first, so a marker that contains another one wins the match
+_NEEDLE_RE = re.compile('|'.join(
+    re.escape(needle) for needle in sorted(_VALIDATION_NEEDLES, key=len, reverse=True)
+))
+
+
+def _scan_needles(content):
+    """Count occurrences of every marker in ``content`` with one pass."""
+    hits = Counter(m.group(0) for m in _NEEDLE_RE.finditer(content))
+    # A marker nested inside a longer matched marker still counts as present
+    return {
+        needle: sum(count for hit, count in hits.items() if needle in hit)
+        for needle in _VALIDATION_NEEDLES
+    }
+
+
+# Scenario trigger -> markers that must be present in validation.py. The
+# first trigger found in a scenario decides which markers it needs.
+SCENARIO_RULES = (
+    ("DROP TABLE", frozenset({"log_security_event"})),
+    ("script", frozenset({"dangerous_patterns"})),
+    ("../", frozenset({"dangerous_patterns"})),
+    ("jndi:", frozenset({"jndi:"})),
+    ("eval(", frozenset({"dangerous_patterns"})),
+    ("1e10", frozenset({"dangerous_patterns"})),
+    ("NaN", frozenset({"security_logger.log_security_event"})),
+    ("inf", frozenset({"security_logger.log_security_event"})),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_validation_src():
+    """Read validation.py once and share the text across all checks."""
+    with open('src/reasoning_library/validation.py', 'r') as f:
+        return f.read()
+
+
+def _function_index(content):
+    """Map each top-level function name to its ``(start, end)`` span."""
+    # Prefixing a newline lets a definition on the first line match too; the
+    # match start then lands exactly on ``def`` in the unprefixed content.
+    starts = [
+        (m.group(1), m.start())
+        for m in re.finditer(r'\ndef\s+(\w+)\s*\(', '\n' + content)
+    ]
+    index = {}
+    for i, (name, start) in enumerate(starts):
+        # A body ends at the newline preceding the next top-level def
+        end = starts[i + 1][1] - 1 if i + 1 < len(starts) else len(content)
+        # Keep the first definition, matching a forward search for the name
+        index.setdefault(name, (start, end))
+    return index
+
 
 def test_security_fixes_code_analysis():
     """Perform final code analysis to verify security fixes."""
     print("🔍 MAJOR-007: Final Security Verification")
-    print("=" * 60)
+    print(_BAR60)
 
     try:
-        with open('src/reasoning_library/validation.py', 'r') as f:
-            content = f.read()
+        content = _load_validation_src()
     except FileNotFoundError:
         print("❌ Could not find validation.py file")
         return False
 
+    counts = _scan_needles(content)
     fixes_verified = []
 
     # Fix 1: Check for security logging import
-    if 'from .security_logging import get_security_logger' in content:
+    if counts['from .security_logging import get_security_logger']:
         fixes_verified.append("✅ Security logging imported")
     else:
         print("❌ Security logging not imported")
@@ -36,7 +119,7 @@ def test_security_fixes_code_analysis():
         'block_action=True'
     ]
 
-    security_aware_count = sum(1 for pattern in security_aware_patterns if pattern in content)
+    security_aware_count = sum(1 for pattern in security_aware_patterns if counts[pattern])
     if security_aware_count >= 2:  # At least logging and SecurityError handling
         fixes_verified.append("✅ Security-aware exception handling implemented")
     else:
@@ -50,7 +133,7 @@ def test_security_fixes_code_analysis():
         'except SecurityError:',
     ]
 
-    specific_count = sum(1 for pattern in specific_exceptions if pattern in content)
+    specific_count = sum(1 for pattern in specific_exceptions if counts[pattern])
     if specific_count >= 2:
         fixes_verified.append("✅ Specific exception handling implemented")
     else:
@@ -65,22 +148,14 @@ def test_security_fixes_code_analysis():
         'validate_metadata_dict',
     ]
 
+    function_spans = _function_index(content)
     functions_with_logging = 0
     for func in key_functions:
-        # Find function definition and check for security logging within it
-        func_pattern = rf'def {func}\('
-        if re.search(func_pattern, content):
-            func_start = re.search(func_pattern, content).start()
-            remaining_content = content[func_start:]
-
-            # Find end of function (next def or end of file)
-            next_def = re.search(r'\ndef\s+\w+\s*\(', remaining_content[1:])
-            if next_def:
-                func_content = remaining_content[:next_def.start() + 1]
-            else:
-                func_content = remaining_content
-
-            if 'security_logger.log_security_event' in func_content:
+        # Look up the function body and check for security logging within it
+        span = function_spans.get(func)
+        if span is not None:
+            start, end = span
+            if content.find('security_logger.log_security_event', start, end) != -1:
                 functions_with_logging += 1
 
     if functions_with_logging >= len(key_functions) - 1:  # Allow for 1 function that might not need it
@@ -96,7 +171,7 @@ def test_security_fixes_code_analysis():
         '"Security violation detected"', # Sanitized security errors
     ]
 
-    sanitized_count = sum(1 for pattern in sanitized_error_patterns if pattern in content)
+    sanitized_count = sum(1 for pattern in sanitized_error_patterns if counts[pattern])
     if sanitized_count >= 2:
         fixes_verified.append("✅ Error message sanitization implemented")
     else:
@@ -104,7 +179,7 @@ def test_security_fixes_code_analysis():
         return False
 
     # Fix 6: Check for dangerous pattern detection
-    if 'dangerous_patterns' in content and 'jndi:' in content:
+    if counts['dangerous_patterns'] and counts['jndi:']:
         fixes_verified.append("✅ Dangerous pattern detection implemented")
     else:
         print("❌ Dangerous pattern detection not found")
@@ -112,7 +187,7 @@ def test_security_fixes_code_analysis():
 
     # Display results
     print("\n📊 SECURITY FIXES VERIFICATION")
-    print("-" * 40)
+    print(_RULE40)
     for fix in fixes_verified:
         print(fix)
 
@@ -123,7 +198,7 @@ def test_security_fixes_code_analysis():
 def test_attack_scenario_protection():
     """Test that attack scenarios are properly handled."""
     print("\n🛡️  Testing Attack Scenario Protection")
-    print("-" * 40)
+    print(_RULE40)
 
     attack_scenarios = [
         "SQL Injection: '; DROP TABLE users; --",
@@ -136,41 +211,32 @@ def test_attack_scenario_protection():
         "Infinity Injection: inf",
     ]
 
+    # This would normally test the actual functions, but since we can't import
+    # we'll verify the protection mechanisms are in place in the code
+    try:
+        counts = _scan_needles(_load_validation_src())
+    except FileNotFoundError:
+        present = None
+    else:
+        present = frozenset(needle for needle, count in counts.items() if count)
+
     protected_scenarios = []
     for scenario in attack_scenarios:
-        # This would normally test the actual functions, but since we can't import
-        # we'll verify the protection mechanisms are in place in the code
-        try:
-            with open('src/reasoning_library/validation.py', 'r') as f:
-                content = f.read()
-
-            # Check if protection mechanisms exist for this scenario
-            has_protection = False
-
-            if "DROP TABLE" in scenario and "log_security_event" in content:
-                has_protection = True
-            elif "script" in scenario and "dangerous_patterns" in content:
-                has_protection = True
-            elif "../" in scenario and "dangerous_patterns" in content:
-                has_protection = True
-            elif "jndi:" in scenario and "jndi:" in content:
-                has_protection = True
-            elif "eval(" in scenario and "dangerous_patterns" in content:
-                has_protection = True
-            elif "1e10" in scenario and "dangerous_patterns" in content:
-                has_protection = True
-            elif "NaN" in scenario and "security_logger.log_security_event" in content:
-                has_protection = True
-            elif "inf" in scenario and "security_logger.log_security_event" in content:
-                has_protection = True
-
-            if has_protection:
-                protected_scenarios.append(f"✅ {scenario}")
-            else:
-                protected_scenarios.append(f"❓ {scenario}")
-
-        except Exception:
+        if present is None:
             protected_scenarios.append(f"⚠️  {scenario}")
+            continue
+
+        # Check if protection mechanisms exist for this scenario
+        required = next(
+            (markers for trigger, markers in SCENARIO_RULES if trigger in scenario),
+            None,
+        )
+        has_protection = required is not None and required <= present
+
+        if has_protection:
+            protected_scenarios.append(f"✅ {scenario}")
+        else:
+            protected_scenarios.append(f"❓ {scenario}")
 
     for protection in protected_scenarios:
         print(f"   {protection}")
@@ -181,47 +247,47 @@ def test_attack_scenario_protection():
 def test_compliance_requirements():
     """Test that security compliance requirements are met."""
     print("\n📋 Testing Security Compliance Requirements")
-    print("-" * 40)
+    print(_RULE40)
 
     requirements = [
         {
             "requirement": "Specific Exception Handling",
             "description": "No broad Exception catches without security logging",
-            "check": lambda content: 'except Exception as e:' in content and 'security_logger.log_security_event' in content
+            "check": lambda content, counts: counts['except Exception as e:'] and counts['security_logger.log_security_event']
         },
         {
             "requirement": "Security Event Logging",
             "description": "All validation failures logged to security monitoring",
-            "check": lambda content: content.count('security_logger.log_security_event') >= 5
+            "check": lambda content, counts: counts['security_logger.log_security_event'] >= 5
         },
         {
             "requirement": "Input Sanitization",
             "description": "Dangerous input patterns detected and logged",
-            "check": lambda content: 'dangerous_patterns' in content and 'jndi:' in content
+            "check": lambda content, counts: counts['dangerous_patterns'] and counts['jndi:']
         },
         {
             "requirement": "Error Message Sanitization",
             "description": "Error messages don't expose internal details",
-            "check": lambda content: '"Invalid input"' in content and 'type(value).__name__' not in content[content.find('def '):content.find('\n\n')]
+            "check": lambda content, counts: counts['"Invalid input"'] and 'type(value).__name__' not in content[content.find('def '):content.find('\n\n')]
         },
         {
             "requirement": "No Silent Failures",
             "description": "Critical operations raise errors instead of returning defaults",
-            "check": lambda content: 'return default_value' not in content or 'except' not in content
+            "check": lambda content, counts: not counts['return default_value'] or 'except' not in content
         }
     ]
 
     try:
-        with open('src/reasoning_library/validation.py', 'r') as f:
-            content = f.read()
+        content = _load_validation_src()
     except FileNotFoundError:
         print("❌ Could not find validation.py file")
         return False
 
+    counts = _scan_needles(content)
     passed_requirements = []
     for requirement in requirements:
         try:
-            if requirement["check"](content):
+            if requirement["check"](content, counts):
                 passed_requirements.append(f"✅ {requirement['requirement']}")
                 print(f"   ✅ {requirement['requirement']}: {requirement['description']}")
             else:
@@ -236,7 +302,7 @@ def test_compliance_requirements():
 def main():
     """Run final comprehensive security verification."""
     print("🔒 MAJOR-007: FINAL COMPREHENSIVE SECURITY VERIFICATION")
-    print("=" * 70)
+    print(_BAR70)
 
     # Run all verification tests
     tests = [
@@ -250,7 +316,7 @@ def main():
 
     for test_name, test_func in tests:
         print(f"\n🧪 {test_name}")
-        print("-" * 50)
+        print(_RULE50)
 
         try:
             if test_func():
@@ -262,9 +328,9 @@ def main():
             print(f"❌ {test_name} ERROR: {e}")
 
     # Final summary
-    print("\n" + "=" * 70)
+    print("\n" + _BAR70)
     print("🏁 FINAL VERIFICATION SUMMARY")
-    print("=" * 70)
+    print(_BAR70)
 
     if passed_tests == total_tests:
         print(f"🎉 ALL {passed_tests}/{total_tests} VERIFICATION TESTS PASSED!")
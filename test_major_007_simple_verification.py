@@ -4,36 +4,68 @@ MAJOR-007: Simple Security Fixes Verification
 Verifies that all critical security fixes are properly implemented.
 """
 
+import functools
+import re
 import sys
 import os
+from pathlib import Path
+
+# Banner lines, built once at import
+_BAR50 = "=" * 50
+_BAR60 = "=" * 60
+_BAR70 = "=" * 70
+_RULE40 = "-" * 40
+
+# Fix name -> source marker checked against validation.py
+FIX_NEEDLES = {
+    "Security logging import": "from .security_logging import get_security_logger",
+    "SecurityError exception handling": "except SecurityError as e:",
+    "Security logging events": "security_logger.log_security_event(",
+    "Dangerous pattern detection": "dangerous_patterns",
+    "JNDI injection protection": "jndi:",
+    "Sanitized error messages": '"Invalid input provided"',
+    "No broad exception masking": "except Exception as e:",
+    "Security event classification": "block_action=True",
+    "Attack pattern logging": '"Potentially dangerous content"',
+}
+
+# Broad handlers are counted rather than just detected, so that marker gets
+# its own pattern; every other marker is found in one alternation pass
+MASK_FIX = "No broad exception masking"
+_MASK_RE = re.compile(re.escape(FIX_NEEDLES[MASK_FIX]))
+_NEEDLE_RE = re.compile("|".join(
+    re.escape(needle) for name, needle in FIX_NEEDLES.items() if name != MASK_FIX
+))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_validation_src():
+    """Read validation.py once per process."""
+    return Path('src/reasoning_library/validation.py').read_text()
+
 
 def verify_security_fixes():
     """Verify the main security fixes are in place."""
     print("🔍 MAJOR-007: Simple Security Fixes Verification")
-    print("=" * 60)
+    print(_BAR60)
 
     try:
-        with open('src/reasoning_library/validation.py', 'r') as f:
-            content = f.read()
+        content = _load_validation_src()
     except FileNotFoundError:
         print("❌ Could not find validation.py")
         return False
 
     # Critical fixes to verify
+    present = {m.group(0) for m in _NEEDLE_RE.finditer(content)}
+    mask_count = sum(1 for _ in _MASK_RE.finditer(content))
     fixes = {
-        "Security logging import": "from .security_logging import get_security_logger" in content,
-        "SecurityError exception handling": "except SecurityError as e:" in content,
-        "Security logging events": "security_logger.log_security_event(" in content,
-        "Dangerous pattern detection": "dangerous_patterns" in content,
-        "JNDI injection protection": "jndi:" in content,
-        "Sanitized error messages": '"Invalid input provided"' in content,
-        "No broad exception masking": content.count("except Exception as e:") <= 4,  # Our secure handlers
-        "Security event classification": 'block_action=True' in content,
-        "Attack pattern logging": '"Potentially dangerous content"' in content,
+        # Broad handlers are tolerated only in our few secure wrappers
+        name: mask_count <= 4 if name == MASK_FIX else needle in present
+        for name, needle in FIX_NEEDLES.items()
     }
 
     print("\n📋 SECURITY FIXES VERIFICATION:")
-    print("-" * 40)
+    print(_RULE40)
 
     passed_fixes = 0
     for fix_name, is_fixed in fixes.items():
@@ -65,7 +97,7 @@ def verify_security_fixes():
 def demonstrate_security_improvements():
     """Demonstrate the key security improvements made."""
     print("\n🚀 SECURITY IMPROVEMENTS DEMONSTRATION")
-    print("=" * 50)
+    print(_BAR50)
 
     improvements = [
         {
@@ -112,7 +144,7 @@ def demonstrate_security_improvements():
 def main():
     """Run simple verification."""
     print("🔒 MAJOR-007: IMPROPER EXCEPTION HANDLING - SECURITY FIXES")
-    print("=" * 70)
+    print(_BAR70)
 
     # Verify fixes
     if not verify_security_fixes():
@@ -122,9 +154,9 @@ def main():
     # Demonstrate improvements
     demonstrate_security_improvements()
 
-    print("\n" + "=" * 70)
+    print("\n" + _BAR70)
     print("🏁 MAJOR-007 RESOLUTION COMPLETE")
-    print("=" * 70)
+    print(_BAR70)
     print("✅ All major exception handling vulnerabilities have been addressed")
     print("✅ Security logging implemented across validation functions")
     print("✅ Error messages sanitized to prevent information disclosure")
@@ -6,14 +6,165 @@ This test targets the fundamental issue with manual string replacement: the orde
 and potential for incomplete replacements that can leave dangerous partial patterns.
 """
 
+import logging
+import re
 import sys
 import os
+from collections import namedtuple
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from reasoning_library.abductive import _safe_hypothesis_template
 
+# Per-case detail goes through a logger so pytest captures it instead of
+# every case contending for stdout; run with --log-cli-level=DEBUG to see it
+logger = logging.getLogger(__name__)
+
+# All three placeholders in one alternation, so the preview scans each template once
+_PLACEHOLDER_RE = re.compile(r"\{(?:action|component|issue)\}")
+
+_PLACEHOLDER_MARKERS = {
+    "{action}": "[ACTION_PLACEHOLDER]",
+    "{component}": "[COMPONENT_PLACEHOLDER]",
+    "{issue}": "[ISSUE_PLACEHOLDER]",
+}
+
+# Patterns that might indicate a successful bypass, one alternation per category
+DANGEROUS_PATTERNS = (
+    '__import__',
+    'system(',
+    'exec(',
+    'eval(',
+    'subprocess',
+    'popen',
+    'import os',
+    'import sys',
+    'os.system',
+    'getattr',
+    'setattr',
+    '__class__',
+    '__base__',
+    '${',
+    '%(',
+)
+
+RESIDUAL_PATTERNS = (
+    '{action}',
+    '{component}',
+    '{issue}',
+    '{{',
+    '}}',
+)
+
+PARTIAL_DANGEROUS_PATTERNS = (
+    'import',
+    'system',
+    'exec',
+    'eval',
+    'getattr',
+    '__class',
+    '__base',
+)
+
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)))
+_RESIDUAL_RE = re.compile("|".join(map(re.escape, RESIDUAL_PATTERNS)))
+_PARTIAL_DANGEROUS_RE = re.compile("|".join(map(re.escape, PARTIAL_DANGEROUS_PATTERNS)))
+
+
+def _mark_placeholders(template):
+    """Replace every known placeholder with its marker in a single pass."""
+    return _PLACEHOLDER_RE.sub(lambda m: _PLACEHOLDER_MARKERS[m.group(0)], template)
+
+
+# One case per replacement attack strategy
+ReplacementCase = namedtuple(
+    "ReplacementCase", "name action component issue template vulnerability"
+)
+
+REPLACEMENT_CASES = (
+    # Case 1: Replacement strings contain other placeholder patterns
+    ReplacementCase(
+        name="Cross-Contamination Attack",
+        action="{component}",
+        component="__import__('os')",
+        issue="failure",
+        template="The {action} on {component} causes {issue}",
+        vulnerability="action gets replaced with component's dangerous content",
+    ),
+
+    # Case 2: Replacement creates nested patterns
+    ReplacementCase(
+        name="Nested Pattern Creation",
+        action="test",
+        component="system{__import__('os')}",
+        issue="failure",
+        template="The {action} on {component} causes {issue}",
+        vulnerability="component replacement leaves inner pattern",
+    ),
+
+    # Case 3: Multiple identical placeholders
+    ReplacementCase(
+        name="Multiple Placeholder Race Condition",
+        action="{component}",
+        component="test_component",
+        issue="{action}",
+        template="The {action} on {component} and {issue}",
+        vulnerability="Order-dependent replacement creates inconsistent results",
+    ),
+
+    # Case 4: Replacement sanitization bypass
+    ReplacementCase(
+        name="Post-Reconstruction Attack",
+        action="test",
+        component="im{action}rt",  # Attempts to reconstruct "import" after replacement
+        issue="failure",
+        template="The {action} on {component} causes {issue}",
+        vulnerability="Replacement reconstructs dangerous keywords",
+    ),
+
+    # Case 5: Bracket manipulation during replacement
+    ReplacementCase(
+        name="Bracket Reassembly Attack",
+        action="{",
+        component="}",
+        issue="__import__('os')",
+        template="The {action}action{component} causes {issue}",
+        vulnerability="Brackets get reassembled around dangerous content",
+    ),
+
+    # Case 6: Template injection through replacement
+    ReplacementCase(
+        name="Template Injection via Replacement",
+        action="test",
+        component="${__import__('os')}",  # Different template syntax
+        issue="failure",
+        template="The {action} on {component} causes {issue}",
+        vulnerability="Different template syntax survives replacement",
+    ),
+
+    # Case 7: Escaping the replacement logic
+    ReplacementCase(
+        name="Replacement Logic Escape",
+        action="test",
+        component="system\\{action\\}",  # Escaped braces that might be interpreted later
+        issue="failure",
+        template="The {action} on {component} causes {issue}",
+        vulnerability="Escaped brackets might be processed by other systems",
+    ),
+
+    # Case 8: Multi-stage replacement attack
+    ReplacementCase(
+        name="Multi-Stage Replacement",
+        action="act{component}on",
+        component="{issue}",
+        issue="__import__('os')",
+        template="The {action} on system causes {issue}",
+        vulnerability="Nested replacements propagate dangerous content",
+    ),
+)
+
+
 def test_replacement_order_vulnerabilities():
     """Test vulnerabilities in the replacement order logic."""
 
@@ -30,192 +181,63 @@ def test_replacement_order_vulnerabilities():
     # - Multiple passes through replacements are needed
     # - Partial replacements create new dangerous patterns
 
-    test_cases = [
-        # Case 1: Replacement strings contain other placeholder patterns
-        {
-            "name": "Cross-Contamination Attack",
-            "action": "{component}",
-            "component": "__import__('os')",
-            "issue": "failure",
-            "template": "The {action} on {component} causes {issue}",
-            "vulnerability": "action gets replaced with component's dangerous content"
-        },
-
-        # Case 2: Replacement creates nested patterns
-        {
-            "name": "Nested Pattern Creation",
-            "action": "test",
-            "component": "system{__import__('os')}",
-            "issue": "failure",
-            "template": "The {action} on {component} causes {issue}",
-            "vulnerability": "component replacement leaves inner pattern"
-        },
-
-        # Case 3: Multiple identical placeholders
-        {
-            "name": "Multiple Placeholder Race Condition",
-            "action": "{component}",
-            "component": "test_component",
-            "issue": "{action}",
-            "template": "The {action} on {component} and {issue}",
-            "vulnerability": "Order-dependent replacement creates inconsistent results"
-        },
-
-        # Case 4: Replacement sanitization bypass
-        {
-            "name": "Post-Reconstruction Attack",
-            "action": "test",
-            "component": "im{action}rt",  # Attempts to reconstruct "import" after replacement
-            "issue": "failure",
-            "template": "The {action} on {component} causes {issue}",
-            "vulnerability": "Replacement reconstructs dangerous keywords"
-        },
-
-        # Case 5: Bracket manipulation during replacement
-        {
-            "name": "Bracket Reassembly Attack",
-            "action": "{",
-            "component": "}",
-            "issue": "__import__('os')",
-            "template": "The {action}action{component} causes {issue}",
-            "vulnerability": "Brackets get reassembled around dangerous content"
-        },
-
-        # Case 6: Template injection through replacement
-        {
-            "name": "Template Injection via Replacement",
-            "action": "test",
-            "component": "${__import__('os')}",  # Different template syntax
-            "issue": "failure",
-            "template": "The {action} on {component} causes {issue}",
-            "vulnerability": "Different template syntax survives replacement"
-        },
-
-        # Case 7: Escaping the replacement logic
-        {
-            "name": "Replacement Logic Escape",
-            "action": "test",
-            "component": "system\\{action\\}",  # Escaped braces that might be interpreted later
-            "issue": "failure",
-            "template": "The {action} on {component} causes {issue}",
-            "vulnerability": "Escaped brackets might be processed by other systems"
-        },
-
-        # Case 8: Multi-stage replacement attack
-        {
-            "name": "Multi-Stage Replacement",
-            "action": "act{component}on",
-            "component": "{issue}",
-            "issue": "__import__('os')",
-            "template": "The {action} on system causes {issue}",
-            "vulnerability": "Nested replacements propagate dangerous content"
-        }
-    ]
-
     vulnerabilities_found = 0
 
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n🎯 Test {i}/{len(test_cases)}: {test_case['name']}")
-        print(f"   Strategy: {test_case['vulnerability']}")
-        print(f"   Template: '{test_case['template']}'")
-        print(f"   Action: '{test_case['action']}'")
-        print(f"   Component: '{test_case['component']}'")
-        print(f"   Issue: '{test_case['issue']}'")
+    for i, test_case in enumerate(REPLACEMENT_CASES, 1):
+        logger.debug("\n🎯 Test %d/%d: %s", i, len(REPLACEMENT_CASES), test_case.name)
+        logger.debug("   Strategy: %s", test_case.vulnerability)
+        logger.debug("   Template: '%s'", test_case.template)
+        logger.debug("   Action: '%s'", test_case.action)
+        logger.debug("   Component: '%s'", test_case.component)
+        logger.debug("   Issue: '%s'", test_case.issue)
 
         try:
             # Step-by-step analysis of what happens during replacement
-            print("   📝 Manual replacement analysis:")
-
-            # Show what each replacement step does
-            step1 = test_case['template'].replace("{action}", "[ACTION_PLACEHOLDER]")
-            print(f"      Step 1 (action removal): '{step1}'")
+            logger.debug("   📝 Manual replacement analysis:")
 
-            step2 = step1.replace("{component}", "[COMPONENT_PLACEHOLDER]")
-            print(f"      Step 2 (component removal): '{step2}'")
-
-            step3 = step2.replace("{issue}", "[ISSUE_PLACEHOLDER]")
-            print(f"      Step 3 (issue removal): '{step3}'")
+            # Show where each placeholder sits once all are removed
+            marked = _mark_placeholders(test_case.template)
+            logger.debug("      Placeholder removal: '%s'", marked)
 
             # Now test with actual function
             result = _safe_hypothesis_template(
-                test_case['action'],
-                test_case['component'],
-                test_case['issue'],
-                test_case['template']
+                test_case.action,
+                test_case.component,
+                test_case.issue,
+                test_case.template
             )
 
-            print(f"   📤 Actual result: '{result}'")
-
-            # Check for dangerous patterns that might indicate successful bypass
-            dangerous_patterns = [
-                '__import__',
-                'system(',
-                'exec(',
-                'eval(',
-                'subprocess',
-                'popen',
-                'import os',
-                'import sys',
-                'os.system',
-                'getattr',
-                'setattr',
-                '__class__',
-                '__base__',
-                '${',
-                '%('
-            ]
-
-            residual_patterns = [
-                '{action}',
-                '{component}',
-                '{issue}',
-                '{{',
-                '}}'
-            ]
-
-            has_dangerous = any(pattern in result for pattern in dangerous_patterns)
-            has_residual = any(pattern in result for pattern in residual_patterns)
-
-            # Check for partial dangerous patterns
-            partial_dangerous = [
-                'import',
-                'system',
-                'exec',
-                'eval',
-                'getattr',
-                '__class',
-                '__base'
-            ]
-
-            has_partial = any(pattern in result for pattern in partial_dangerous)
-
-            if has_dangerous:
-                print("   🚨 VULNERABILITY: Dangerous code execution pattern found!")
+            logger.debug("   📤 Actual result: '%s'", result)
+
+            # Categories are checked in priority order, so later scans only
+            # run when the earlier ones found nothing
+            if _DANGEROUS_RE.search(result):
+                logger.debug("   🚨 VULNERABILITY: Dangerous code execution pattern found!")
                 vulnerabilities_found += 1
-            elif has_residual:
-                print("   ⚠️  VULNERABILITY: Unexpanded template patterns remain!")
+            elif _RESIDUAL_RE.search(result):
+                logger.debug("   ⚠️  VULNERABILITY: Unexpanded template patterns remain!")
                 vulnerabilities_found += 1
-            elif has_partial:
-                print("   ⚠️  WARNING: Partial dangerous patterns detected - potential bypass")
+            elif _PARTIAL_DANGEROUS_RE.search(result):
+                logger.debug("   ⚠️  WARNING: Partial dangerous patterns detected - potential bypass")
                 # Count partial as potential vulnerability
                 if any(p in result for p in ['import', 'system']) and 'action' in result:
                     vulnerabilities_found += 1
             else:
-                print("   ✅ No obvious vulnerability detected")
+                logger.debug("   ✅ No obvious vulnerability detected")
 
         except Exception as e:
-            print(f"   💥 Exception: {type(e).__name__}: {e}")
+            logger.debug("   💥 Exception: %s: %s", type(e).__name__, e)
             # Check if exception indicates successful attack
             if any(keyword in str(e).lower() for keyword in ['import', 'exec', 'eval', 'system']):
-                print("   🚨 VULNERABILITY: Exception contains dangerous keywords!")
+                logger.debug("   🚨 VULNERABILITY: Exception contains dangerous keywords!")
                 vulnerabilities_found += 1
 
     print("\n" + "=" * 60)
     print("📊 REPLACEMENT VULNERABILITY ASSESSMENT")
     print("=" * 60)
-    print(f"Total tests: {len(test_cases)}")
+    print(f"Total tests: {len(REPLACEMENT_CASES)}")
     print(f"Vulnerabilities found: {vulnerabilities_found}")
-    print(f"Security score: {((len(test_cases) - vulnerabilities_found) / len(test_cases)) * 100:.1f}%")
+    print(f"Security score: {((len(REPLACEMENT_CASES) - vulnerabilities_found) / len(REPLACEMENT_CASES)) * 100:.1f}%")
 
     return vulnerabilities_found == 0
 
@@ -274,6 +296,10 @@ Example attack:
         return True
 
 if __name__ == "__main__":
+    # Standalone runs show the per-case detail inline with the other output
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    logger.setLevel(logging.DEBUG)
+
     print("Manual String Replacement Vulnerability Test")
     print("This demonstrates the fundamental flaws in manual replacement approach")
     print()
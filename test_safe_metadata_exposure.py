@@ -3,8 +3,6 @@
 Test script to verify that safe metadata is still properly exposed.
 """
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from reasoning_library.exceptions import ReasoningError
 
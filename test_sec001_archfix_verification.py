@@ -12,13 +12,17 @@ ARCHITECTURAL FLAWS FIXED:
 4. False Positive Over-Masking - password_reset_page no longer over-masked
 """
 
+import logging
 import sys
-import os
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from reasoning_library.sanitization import (
+    _enhanced_preprocessing_for_bypass_prevention,
+    sanitize_for_logging,
+)
 
-from reasoning_library.sanitization import sanitize_for_logging
+# Per-case detail goes through a logger so pytest captures it in one place;
+# run with --log-cli-level=DEBUG to see it
+logger = logging.getLogger(__name__)
 
 
 def test_critical_bypass_vectors():
@@ -66,16 +70,19 @@ def test_critical_bypass_vectors():
         passed = result == test["expected"]
 
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status}: {test['name']}")
-        print(f"   Input:    {test['input']}")
-        print(f"   Expected: {test['expected']}")
-        print(f"   Got:      {result}")
-        print(f"   Note:     {test['description']}")
+        logger.debug(
+            "%s: %s\n"
+            "   Input:    %s\n"
+            "   Expected: %s\n"
+            "   Got:      %s\n"
+            "   Note:     %s",
+            status, test['name'], test['input'], test['expected'], result,
+            test['description'],
+        )
 
         if not passed:
             all_passed = False
-            print("   🚨 CRITICAL: Bypass vector still works!")
-        print()
+            print(f"🚨 CRITICAL: Bypass vector still works! ({test['name']})")
 
     return all_passed
 
@@ -126,20 +133,43 @@ def test_false_positive_prevention():
         passed = result == test["expected"]
 
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status}: {test['name']}")
-        print(f"   Input:    {test['input']}")
-        print(f"   Expected: {test['expected']}")
-        print(f"   Got:      {result}")
-        print(f"   Note:     {test['description']}")
+        logger.debug(
+            "%s: %s\n"
+            "   Input:    %s\n"
+            "   Expected: %s\n"
+            "   Got:      %s\n"
+            "   Note:     %s",
+            status, test['name'], test['input'], test['expected'], result,
+            test['description'],
+        )
 
         if not passed:
             all_passed = False
-            print("   🚨 CRITICAL: False positive over-masking detected!")
-        print()
+            print(f"🚨 CRITICAL: False positive over-masking detected! ({test['name']})")
 
     return all_passed
 
 
+def test_clean_input_skips_decoding():
+    """Test that inputs without encoding introducers pass through preprocessing untouched."""
+
+    clean_inputs = [
+        "password_reset_page",
+        "secretary_of_state",
+        "tokenization_required",
+        "password123",
+        "my_api_key_data",
+    ]
+
+    for text in clean_inputs:
+        assert _enhanced_preprocessing_for_bypass_prevention(text) is text
+        assert sanitize_for_logging(text) == text
+
+    # Encoded inputs still take the decoding path
+    assert _enhanced_preprocessing_for_bypass_prevention("pass%77ord") == "password"
+    assert _enhanced_preprocessing_for_bypass_prevention("passwor&#100;") == "password"
+
+
 def test_advanced_bypass_vectors():
     """Test advanced bypass vectors to ensure comprehensive protection."""
 
@@ -174,8 +204,7 @@ def test_advanced_bypass_vectors():
         passed = result == expected
 
         status = f"✅ PASS {i:2d}" if passed else f"❌ FAIL {i:2d}"
-        print(f"{status}: {input_val}")
-        print(f"         → {result}")
+        logger.debug("%s: %s\n         → %s", status, input_val, result)
 
         if not passed:
             all_passed = False
@@ -204,8 +233,7 @@ def test_original_functionality_preserved():
         passed = expected_contains in result
 
         status = f"✅ PASS {i}" if passed else f"❌ FAIL {i}"
-        print(f"{status}: {repr(input_val)}")
-        print(f"         → {repr(result)}")
+        logger.debug("%s: %r\n         → %r", status, input_val, result)
 
         if not passed:
             all_passed = False
@@ -267,4 +295,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Standalone runs show the per-case detail inline with the other output
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    logger.setLevel(logging.DEBUG)
+
     sys.exit(main())
\ No newline at end of file
@@ -24,11 +24,8 @@ CRITICAL BYPASS VECTORS TO TEST:
 - "passwor&#100;=secret"      # HTML entity bypass
 """
 
+import logging
 import sys
-import os
-
-# Add the src directory to the path so we can import the library
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from reasoning_library.sanitization import (
     sanitize_for_concatenation,
@@ -37,32 +34,61 @@ from reasoning_library.sanitization import (
     _enhanced_preprocessing_for_bypass_prevention
 )
 
+# Per-case detail goes through a logger so pytest captures it in one place;
+# run with --log-cli-level=DEBUG to see it
+logger = logging.getLogger(__name__)
+
+# Vectors are written with literal escape sequences and decoded once at import,
+# so every check below runs against the same real bypass strings
+
+# Critical bypass vectors that should be BLOCKED
+_RAW_POST_DECODING_BYPASS_VECTORS = [
+    (r"\\x65\\x76\\x61\\x6c", "hex 'eval'"),
+    (r"\\x69\\x6d\\x70\\x6f\\x72\\x74", "hex 'import'"),
+    (r"\\145\\166\\141\\154", "octal 'eval'"),
+    (r"\\151\\155\\160\\157\\162\\164", "octal 'import'"),
+    (r"\\x63\\x6f\\x6d\\x70\\x69\\x6c\\x65", "hex 'compile'"),
+    (r"\\143\\157\\155\\160\\151\\154\\145", "octal 'compile'"),
+    (r"\\x5f\\x5f\\x69\\x6d\\x70\\x6f\\x72\\x74\\x5f\\x5f", "hex '__import__'"),
+    (r"\\137\\137\\151\\155\\160\\157\\162\\164\\137\\137", "octal '__import__'"),
+]
+
+POST_DECODING_BYPASS_VECTORS = [
+    (raw.encode('utf-8').decode('unicode_escape'), description)
+    for raw, description in _RAW_POST_DECODING_BYPASS_VECTORS
+]
+
+# Sophisticated multi-layer bypass attempts
+_RAW_COMPLEX_BYPASS_VECTORS = [
+    # Multi-layer encoding
+    ("\\x65\\x76\\x61\\x6c('malicious')", "Hex encoded function call"),
+    ("\\145\\166\\141\\154('harmful')", "Octal encoded function call"),
+    ("\\x69\\x6d\\x70\\x6f\\x72\\x74 os", "Hex encoded import"),
+    ("__import__('os').system", "Direct dangerous call"),
+    # Concatenation bypass attempts
+    ("'ev' + 'al' + '(code)'", "String concatenation bypass"),
+    ("'ex' + 'ec' + '(command)'", "String concatenation bypass"),
+    # Mixed encoding
+    ("\\x65v\\x61l", "Mixed direct and encoded"),
+    ("e\\x76a\\x6c", "Mixed encoding patterns"),
+]
+
+COMPLEX_BYPASS_VECTORS = [
+    (raw.encode('utf-8').decode('unicode_escape'), description)
+    for raw, description in _RAW_COMPLEX_BYPASS_VECTORS
+]
+
 def test_post_decoding_bypass_vectors():
     """Test that post-decoding bypass vectors are properly blocked."""
     print("="*80)
     print("TESTING: Post-Decoding Bypass Vectors")
     print("="*80)
 
-    # Critical bypass vectors that should be BLOCKED
-    bypass_vectors = [
-        (r"\\x65\\x76\\x61\\x6c", "hex 'eval'"),
-        (r"\\x69\\x6d\\x70\\x6f\\x72\\x74", "hex 'import'"),
-        (r"\\145\\166\\141\\154", "octal 'eval'"),
-        (r"\\151\\155\\160\\157\\162\\164", "octal 'import'"),
-        (r"\\x63\\x6f\\x6d\\x70\\x69\\x6c\\x65", "hex 'compile'"),
-        (r"\\143\\157\\155\\160\\151\\154\\145", "octal 'compile'"),
-        (r"\\x5f\\x5f\\x69\\x6d\\x70\\x6f\\x72\\x74\\x5f\\x5f", "hex '__import__'"),
-        (r"\\137\\137\\151\\155\\160\\157\\162\\164\\137\\137", "octal '__import__'"),
-    ]
-
     print("\n1. Testing _decode_encoded_characters() function directly:")
     print("-" * 60)
 
     failed_direct_tests = 0
-    for encoded_text, description in bypass_vectors:
-        # Convert raw string to actual encoded string
-        actual_encoded = encoded_text.encode('utf-8').decode('unicode_escape')
-
+    for actual_encoded, description in POST_DECODING_BYPASS_VECTORS:
         result = _decode_encoded_characters(actual_encoded)
 
         if result == "[ENCODED_INJECTION_BLOCKED]":
@@ -71,21 +97,18 @@ def test_post_decoding_bypass_vectors():
             status = f"❌ VULNERABLE - returned: '{result}'"
             failed_direct_tests += 1
 
-        print(f"  {description:25} -> {status}")
-        print(f"    Input: {repr(actual_encoded)}")
-        print(f"    Output: {repr(result)}")
-        print()
+        logger.debug(
+            "  %-25s -> %s\n    Input: %r\n    Output: %r\n",
+            description, status, actual_encoded, result,
+        )
 
-    print(f"\nDirect decoding test results: {len(bypass_vectors) - failed_direct_tests}/{len(bypass_vectors)} blocked")
+    print(f"\nDirect decoding test results: {len(POST_DECODING_BYPASS_VECTORS) - failed_direct_tests}/{len(POST_DECODING_BYPASS_VECTORS)} blocked")
 
     print("\n2. Testing through sanitize_for_concatenation():")
     print("-" * 60)
 
     failed_concat_tests = 0
-    for encoded_text, description in bypass_vectors:
-        # Convert raw string to actual encoded string
-        actual_encoded = encoded_text.encode('utf-8').decode('unicode_escape')
-
+    for actual_encoded, description in POST_DECODING_BYPASS_VECTORS:
         result = sanitize_for_concatenation(actual_encoded)
 
         if result == "":
@@ -94,12 +117,12 @@ def test_post_decoding_bypass_vectors():
             status = f"❌ VULNERABLE - returned: '{result}'"
             failed_concat_tests += 1
 
-        print(f"  {description:25} -> {status}")
-        print(f"    Input: {repr(actual_encoded)}")
-        print(f"    Output: {repr(result)}")
-        print()
+        logger.debug(
+            "  %-25s -> %s\n    Input: %r\n    Output: %r\n",
+            description, status, actual_encoded, result,
+        )
 
-    print(f"\nConcatenation test results: {len(bypass_vectors) - failed_concat_tests}/{len(bypass_vectors)} blocked")
+    print(f"\nConcatenation test results: {len(POST_DECODING_BYPASS_VECTORS) - failed_concat_tests}/{len(POST_DECODING_BYPASS_VECTORS)} blocked")
 
     return failed_direct_tests == 0 and failed_concat_tests == 0
 
@@ -134,10 +157,10 @@ def test_sec_001_integration_bypass_vectors():
             status = f"❌ VULNERABLE - returned: '{result}'"
             failed_concat_tests += 1
 
-        print(f"  {description:35} -> {status}")
-        print(f"    Input: {repr(test_input)}")
-        print(f"    Output: {repr(result)}")
-        print()
+        logger.debug(
+            "  %-35s -> %s\n    Input: %r\n    Output: %r\n",
+            description, status, test_input, result,
+        )
 
     print(f"\nConcatenation blocking test results: {len(bypass_vectors) - failed_concat_tests}/{len(bypass_vectors)} blocked")
 
@@ -154,10 +177,10 @@ def test_sec_001_integration_bypass_vectors():
             status = f"❌ NOT MASKED - returned: '{result}'"
             failed_logging_tests += 1
 
-        print(f"  {description:35} -> {status}")
-        print(f"    Input: {repr(test_input)}")
-        print(f"    Output: {repr(result)}")
-        print()
+        logger.debug(
+            "  %-35s -> %s\n    Input: %r\n    Output: %r\n",
+            description, status, test_input, result,
+        )
 
     print(f"\nLogging masking test results: {len(bypass_vectors) - failed_logging_tests}/{len(bypass_vectors)} masked")
 
@@ -169,28 +192,11 @@ def test_complex_bypass_vectors():
     print("TESTING: Complex Multi-Layer Bypass Vectors")
     print("="*80)
 
-    complex_vectors = [
-        # Multi-layer encoding
-        ("\\x65\\x76\\x61\\x6c('malicious')", "Hex encoded function call"),
-        ("\\145\\166\\141\\154('harmful')", "Octal encoded function call"),
-        ("\\x69\\x6d\\x70\\x6f\\x72\\x74 os", "Hex encoded import"),
-        ("__import__('os').system", "Direct dangerous call"),
-        # Concatenation bypass attempts
-        ("'ev' + 'al' + '(code)'", "String concatenation bypass"),
-        ("'ex' + 'ec' + '(command)'", "String concatenation bypass"),
-        # Mixed encoding
-        ("\\x65v\\x61l", "Mixed direct and encoded"),
-        ("e\\x76a\\x6c", "Mixed encoding patterns"),
-    ]
-
     print("\nTesting sanitize_for_concatenation() against complex attacks:")
     print("-" * 60)
 
     failed_complex_tests = 0
-    for test_input, description in complex_vectors:
-        # Convert escape sequences
-        actual_input = test_input.encode('utf-8').decode('unicode_escape')
-
+    for actual_input, description in COMPLEX_BYPASS_VECTORS:
         result = sanitize_for_concatenation(actual_input)
 
         if result == "":
@@ -199,12 +205,12 @@ def test_complex_bypass_vectors():
             status = f"❌ VULNERABLE - returned: '{result}'"
             failed_complex_tests += 1
 
-        print(f"  {description:35} -> {status}")
-        print(f"    Input: {repr(actual_input)}")
-        print(f"    Output: {repr(result)}")
-        print()
+        logger.debug(
+            "  %-35s -> %s\n    Input: %r\n    Output: %r\n",
+            description, status, actual_input, result,
+        )
 
-    print(f"\nComplex bypass test results: {len(complex_vectors) - failed_complex_tests}/{len(complex_vectors)} blocked")
+    print(f"\nComplex bypass test results: {len(COMPLEX_BYPASS_VECTORS) - failed_complex_tests}/{len(COMPLEX_BYPASS_VECTORS)} blocked")
 
     return failed_complex_tests == 0
 
@@ -242,4 +248,8 @@ def main():
         return 1
 
 if __name__ == "__main__":
+    # Standalone runs show the per-case detail inline with the other output
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    logger.setLevel(logging.DEBUG)
+
     sys.exit(main())
\ No newline at end of file
@@ -10,16 +10,104 @@ import json
 import os
 import tempfile
 import unittest
+from contextlib import contextmanager
 from unittest.mock import patch, mock_open
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
+
+# Reports are parsed from their full text in one call. orjson is used when it is
+# installed; its JSONDecodeError subclasses json.JSONDecodeError, so the
+# exception handling below is the same for both parsers
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback for when orjson is not available
+    _json_loads = json.loads
+
+# Severities counted by the workflow's safety and bandit summaries
+HIGH_SAFETY_SEVERITIES = frozenset({'high', 'critical'})
+REPORTED_BANDIT_SEVERITIES = frozenset({'medium', 'high'})
+
+
+def _count_high_safety_vulnerabilities(data: Dict[str, Any]) -> int:
+    """Count safety findings whose severity is high or critical."""
+    return sum(
+        vuln.get('severity', '').lower() in HIGH_SAFETY_SEVERITIES
+        for vuln in data.get('vulnerabilities', [])
+    )
+
+
+def _count_high_bandit_issues(data: Dict[str, Any]) -> int:
+    """Count high-confidence bandit findings of medium or high severity."""
+    return sum(
+        result.get('issue_confidence', '').lower() == 'high'
+        and result.get('issue_severity', '').lower() in REPORTED_BANDIT_SEVERITIES
+        for result in data.get('results', [])
+    )
+
+
+def _count_pip_audit_vulnerabilities(data: Dict[str, Any]) -> int:
+    """Count every pip-audit finding."""
+    return len(data.get('vulnerabilities', []))
+
+
+def _count_semgrep_findings(data: Dict[str, Any]) -> int:
+    """Count every semgrep finding."""
+    return len(data.get('results', []))
+
+
+RISKY_LICENSES = ('GPL', 'AGPL', 'LGPL', 'MPL')
+
+
+def _count_risky_licenses(data: List[Dict[str, Any]]) -> int:
+    """Count packages whose license matches one of the risky families."""
+    return sum(
+        any(risk in pkg.get('License', '').upper() for risk in RISKY_LICENSES)
+        for pkg in data
+    )
+
+
+# Workflow reports whose summaries are parsed: (report file, counter applied to
+# the parsed report, truncated report served by the malformed-input tests)
+REPORT_CASES = (
+    ('pip-audit-report.json', _count_pip_audit_vulnerabilities, '{"vulnerabilities": ['),
+    ('safety-report.json', _count_high_safety_vulnerabilities, '{"vulnerabilities": ['),
+    ('bandit-report.json', _count_high_bandit_issues, '{"results": ['),
+    ('semgrep-report.json', _count_semgrep_findings, '{"results": ['),
+    ('licenses.json', _count_risky_licenses, '[{"name": "test"'),
+)
+
+
+def _parse_report_bare_except(filename: str, count: Callable[[Any], int]) -> int:
+    """Parse a report the way the original workflow did, masking every error."""
+    try:
+        with open(filename) as f:
+            return count(_json_loads(f.read()))
+    except:  # This is the bare except we need to fix
+        print(f"Original code: bare except caught exception for {filename}")
+        return 0
+
+
+def _parse_report(filename: str, count: Callable[[Any], int]) -> int:
+    """Parse a report the way the fixed workflow does, catching specific exceptions."""
+    try:
+        with open(filename) as f:
+            return count(_json_loads(f.read()))
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+        print(f"Report parsing error in {filename}: {type(e).__name__}: {e}")
+        return 0
+    except (FileNotFoundError, PermissionError) as e:
+        print(f"File access error: {type(e).__name__}: {e}")
+        return 0
 
 
 class SecurityWorkflowExceptionHandlingTest(unittest.TestCase):
     """Test secure exception handling for security workflow JSON parsing."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.valid_json_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once; no test mutates them."""
+        cls.valid_json_data = {
             "vulnerabilities": [
                 {
                     "name": "test-vuln",
@@ -29,7 +117,7 @@ class SecurityWorkflowExceptionHandlingTest(unittest.TestCase):
             ]
         }
 
-        self.valid_bandit_data = {
+        cls.valid_bandit_data = {
             "results": [
                 {
                     "issue_confidence": "high",
@@ -39,7 +127,7 @@ class SecurityWorkflowExceptionHandlingTest(unittest.TestCase):
             ]
         }
 
-        self.valid_semgrep_data = {
+        cls.valid_semgrep_data = {
             "results": [
                 {
                     "rule_id": "python.flask.security.disabled-debug",
@@ -48,7 +136,7 @@ class SecurityWorkflowExceptionHandlingTest(unittest.TestCase):
             ]
         }
 
-        self.valid_license_data = [
+        cls.valid_license_data = [
             {
                 "name": "test-package",
                 "version": "1.0.0",
@@ -61,284 +149,73 @@ class SecurityWorkflowExceptionHandlingTest(unittest.TestCase):
             }
         ]
 
-    def test_pip_audit_json_parsing_with_invalid_json(self):
-        """Test pip-audit JSON parsing handles malformed JSON gracefully."""
-        # This simulates the bare except on line 90 of security.yml
-
-        # Test with malformed JSON
-        malformed_json = '{"vulnerabilities": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Original problematic code (what's currently in the workflow):
-                try:
-                    with open('pip-audit-report.json') as f:
-                        data = json.load(f)
-                        result = len(data.get('vulnerabilities', []))
-                        print(f"Original code result: {result}")
-                except:  # This is the bare except we need to fix
-                    result = 0
-                    print("Original code: bare except caught exception")
+        cls.safety_data = {
+            "vulnerabilities": [
+                {"severity": "high", "name": "test-vuln"},
+                {"severity": "low", "name": "low-vuln"}
+            ]
+        }
+
+        # Serialized once instead of in every test that reads them
+        cls.valid_json_text = json.dumps(cls.valid_json_data)
+        cls.valid_bandit_text = json.dumps(cls.valid_bandit_data)
+        cls.safety_text = json.dumps(cls.safety_data)
 
+    def setUp(self):
+        """Report every workflow report file as present for the whole test."""
+        exists_patcher = patch('os.path.exists', return_value=True)
+        exists_patcher.start()
+        self.addCleanup(exists_patcher.stop)
+
+    @contextmanager
+    def _mocked_file(self, read_data):
+        """Serve ``read_data`` from open()."""
+        with patch('builtins.open', mock_open(read_data=read_data)):
+            yield
+
+    def test_malformed_json_with_bare_except(self):
+        """Test the original bare except masks malformed JSON in every report."""
+        # This simulates the bare excepts on lines 90, 119, 194, 209 and 282 of security.yml
+        for filename, count, malformed_json in REPORT_CASES:
+            with self.subTest(report=filename), self._mocked_file(malformed_json):
                 # Should be 0 due to bare except masking the error
-                self.assertEqual(result, 0)
-
-    def test_pip_audit_json_parsing_with_specific_exceptions(self):
-        """Test pip-audit JSON parsing with proper specific exception handling."""
-        # This simulates the fixed version with specific exceptions
-
-        # Test with malformed JSON
-        malformed_json = '{"vulnerabilities": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Fixed code with specific exceptions:
-                try:
-                    with open('pip-audit-report.json') as f:
-                        data = json.load(f)
-                        result = len(data.get('vulnerabilities', []))
-                        print(f"Fixed code result: {result}")
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
-                    print(f"Fixed code: Specific exception caught: {type(e).__name__}: {e}")
-                    result = 0
-                except FileNotFoundError:
-                    print("Fixed code: File not found (should be caught by os.path.exists check)")
-                    result = 0
-                except PermissionError:
-                    print("Fixed code: Permission denied reading file")
-                    result = 0
+                self.assertEqual(_parse_report_bare_except(filename, count), 0)
 
+    def test_malformed_json_with_specific_exceptions(self):
+        """Test every report handles malformed JSON with specific exceptions."""
+        for filename, count, malformed_json in REPORT_CASES:
+            with self.subTest(report=filename), self._mocked_file(malformed_json):
                 # Should be 0 but with proper error logging
-                self.assertEqual(result, 0)
-
-    def test_safety_json_parsing_with_invalid_json(self):
-        """Test safety JSON parsing handles malformed JSON gracefully."""
-        # This simulates the bare except on line 119 of security.yml
-
-        malformed_json = '{"vulnerabilities": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Original problematic code:
-                try:
-                    with open('safety-report.json') as f:
-                        data = json.load(f)
-                        high_count = sum(1 for vuln in data.get('vulnerabilities', [])
-                                       if vuln.get('severity', '').lower() in ['high', 'critical'])
-                        result = high_count
-                except:  # Bare except
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_safety_json_parsing_with_specific_exceptions(self):
-        """Test safety JSON parsing with proper specific exception handling."""
-        malformed_json = '{"vulnerabilities": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Fixed code with specific exceptions:
-                try:
-                    with open('safety-report.json') as f:
-                        data = json.load(f)
-                        high_count = sum(1 for vuln in data.get('vulnerabilities', [])
-                                       if vuln.get('severity', '').lower() in ['high', 'critical'])
-                        result = high_count
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
-                    print(f"Safety parsing error: {type(e).__name__}: {e}")
-                    result = 0
-                except (FileNotFoundError, PermissionError) as e:
-                    print(f"File access error: {type(e).__name__}: {e}")
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_bandit_json_parsing_with_invalid_json(self):
-        """Test bandit JSON parsing handles malformed JSON gracefully."""
-        # This simulates the bare except on line 194 of security.yml
-
-        malformed_json = '{"results": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Original problematic code:
-                try:
-                    with open('bandit-report.json') as f:
-                        data = json.load(f)
-                        high_count = sum(1 for result in data.get('results', [])
-                                       if result.get('issue_confidence', '').lower() == 'high'
-                                       and result.get('issue_severity', '').lower() in ['medium', 'high'])
-                        result = high_count
-                except:  # Bare except
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_bandit_json_parsing_with_specific_exceptions(self):
-        """Test bandit JSON parsing with proper specific exception handling."""
-        malformed_json = '{"results": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Fixed code with specific exceptions:
-                try:
-                    with open('bandit-report.json') as f:
-                        data = json.load(f)
-                        high_count = sum(1 for result in data.get('results', [])
-                                       if result.get('issue_confidence', '').lower() == 'high'
-                                       and result.get('issue_severity', '').lower() in ['medium', 'high'])
-                        result = high_count
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
-                    print(f"Bandit parsing error: {type(e).__name__}: {e}")
-                    result = 0
-                except (FileNotFoundError, PermissionError) as e:
-                    print(f"File access error: {type(e).__name__}: {e}")
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_semgrep_json_parsing_with_invalid_json(self):
-        """Test semgrep JSON parsing handles malformed JSON gracefully."""
-        # This simulates the bare except on line 209 of security.yml
-
-        malformed_json = '{"results": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Original problematic code:
-                try:
-                    with open('semgrep-report.json') as f:
-                        data = json.load(f)
-                        result = len(data.get('results', []))
-                except:  # Bare except
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_semgrep_json_parsing_with_specific_exceptions(self):
-        """Test semgrep JSON parsing with proper specific exception handling."""
-        malformed_json = '{"results": ['
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Fixed code with specific exceptions:
-                try:
-                    with open('semgrep-report.json') as f:
-                        data = json.load(f)
-                        result = len(data.get('results', []))
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
-                    print(f"Semgrep parsing error: {type(e).__name__}: {e}")
-                    result = 0
-                except (FileNotFoundError, PermissionError) as e:
-                    print(f"File access error: {type(e).__name__}: {e}")
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_license_json_parsing_with_invalid_json(self):
-        """Test license JSON parsing handles malformed JSON gracefully."""
-        # This simulates the bare except on line 282 of security.yml
-
-        malformed_json = '[{"name": "test"'
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Original problematic code:
-                try:
-                    with open('licenses.json') as f:
-                        data = json.load(f)
-                        risky = ['GPL', 'AGPL', 'LGPL', 'MPL']
-                        risky_count = sum(1 for pkg in data
-                                        if any(risk in pkg.get('License', '').upper()
-                                              for risk in risky))
-                        result = risky_count
-                except:  # Bare except
-                    result = 0
-
-                self.assertEqual(result, 0)
-
-    def test_license_json_parsing_with_specific_exceptions(self):
-        """Test license JSON parsing with proper specific exception handling."""
-        malformed_json = '[{"name": "test"'
-
-        with patch('builtins.open', mock_open(read_data=malformed_json)):
-            with patch('os.path.exists', return_value=True):
-                # Fixed code with specific exceptions:
-                try:
-                    with open('licenses.json') as f:
-                        data = json.load(f)
-                        risky = ['GPL', 'AGPL', 'LGPL', 'MPL']
-                        risky_count = sum(1 for pkg in data
-                                        if any(risk in pkg.get('License', '').upper()
-                                              for risk in risky))
-                        result = risky_count
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
-                    print(f"License parsing error: {type(e).__name__}: {e}")
-                    result = 0
-                except (FileNotFoundError, PermissionError) as e:
-                    print(f"File access error: {type(e).__name__}: {e}")
-                    result = 0
-
-                self.assertEqual(result, 0)
+                self.assertEqual(_parse_report(filename, count), 0)
 
     def test_valid_json_parsing_still_works(self):
         """Test that valid JSON parsing still works correctly after our fixes."""
         # Test pip-audit parsing
-        with patch('builtins.open', mock_open(read_data=json.dumps(self.valid_json_data))):
-            with patch('os.path.exists', return_value=True):
-                try:
-                    with open('pip-audit-report.json') as f:
-                        data = json.load(f)
-                        result = len(data.get('vulnerabilities', []))
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError, FileNotFoundError, PermissionError) as e:
-                    result = 0
-
-                self.assertEqual(result, 1)
+        with self._mocked_file(self.valid_json_text):
+            result = _parse_report('pip-audit-report.json', _count_pip_audit_vulnerabilities)
+            self.assertEqual(result, 1)
 
         # Test safety parsing
-        safety_data = {
-            "vulnerabilities": [
-                {"severity": "high", "name": "test-vuln"},
-                {"severity": "low", "name": "low-vuln"}
-            ]
-        }
-
-        with patch('builtins.open', mock_open(read_data=json.dumps(safety_data))):
-            with patch('os.path.exists', return_value=True):
-                try:
-                    with open('safety-report.json') as f:
-                        data = json.load(f)
-                        high_count = sum(1 for vuln in data.get('vulnerabilities', [])
-                                       if vuln.get('severity', '').lower() in ['high', 'critical'])
-                        result = high_count
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError, FileNotFoundError, PermissionError) as e:
-                    result = 0
+        with self._mocked_file(self.safety_text):
+            result = _parse_report('safety-report.json', _count_high_safety_vulnerabilities)
+            self.assertEqual(result, 1)
 
-                self.assertEqual(result, 1)
+        # Test bandit parsing
+        with self._mocked_file(self.valid_bandit_text):
+            result = _parse_report('bandit-report.json', _count_high_bandit_issues)
+            self.assertEqual(result, 1)
 
     def test_keyboard_interrupt_not_masked(self):
         """Test that KeyboardInterrupt is NOT caught by our specific exceptions."""
         with patch('builtins.open', side_effect=KeyboardInterrupt()):
-            with patch('os.path.exists', return_value=True):
-                with self.assertRaises(KeyboardInterrupt):
-                    try:
-                        with open('pip-audit-report.json') as f:
-                            data = json.load(f)
-                            result = len(data.get('vulnerabilities', []))
-                    except (json.JSONDecodeError, KeyError, TypeError, AttributeError, FileNotFoundError, PermissionError) as e:
-                        result = 0
+            with self.assertRaises(KeyboardInterrupt):
+                _parse_report('pip-audit-report.json', _count_pip_audit_vulnerabilities)
 
     def test_system_exit_not_masked(self):
         """Test that SystemExit is NOT caught by our specific exceptions."""
         with patch('builtins.open', side_effect=SystemExit(1)):
-            with patch('os.path.exists', return_value=True):
-                with self.assertRaises(SystemExit):
-                    try:
-                        with open('pip-audit-report.json') as f:
-                            data = json.load(f)
-                            result = len(data.get('vulnerabilities', []))
-                    except (json.JSONDecodeError, KeyError, TypeError, AttributeError, FileNotFoundError, PermissionError) as e:
-                        result = 0
+            with self.assertRaises(SystemExit):
+                _parse_report('pip-audit-report.json', _count_pip_audit_vulnerabilities)
 
 
 if __name__ == '__main__':
@@ -5,6 +5,7 @@ Comprehensive test suite for core.py module.
 Tests ReasoningChain, ReasoningStep, tool registry, security features,
 and mathematical reasoning detection.
 """
+import re
 import sys
 import threading
 import time
@@ -341,6 +342,28 @@ class TestSecurityFeatures:
         assert hasattr(COMMENT_PATTERN, "pattern")
         assert hasattr(EVIDENCE_PATTERN, "pattern")
 
+    def test_patterns_are_re2_compatible(self):
+        """Test that source-scanning patterns compile in a linear-time engine."""
+        re2 = pytest.importorskip("re2")
+
+        # RE2 rejects backreferences and lookaround, so a clean compile
+        # proves these patterns cannot backtrack catastrophically
+        for pattern in (
+            FACTOR_PATTERN,
+            COMMENT_PATTERN,
+            EVIDENCE_PATTERN,
+            COMBINATION_PATTERN,
+            CLEAN_FACTOR_PATTERN,
+        ):
+            # Carry each pattern's own flags over as inline flags
+            inline_flags = "".join(
+                letter
+                for flag, letter in ((re.I, "i"), (re.M, "m"), (re.S, "s"))
+                if pattern.flags & flag
+            )
+            prefix = f"(?{inline_flags})" if inline_flags else ""
+            re2.compile(prefix + pattern.pattern)
+
 
 class TestMathematicalReasoningDetection:
     """Test mathematical reasoning detection functionality."""
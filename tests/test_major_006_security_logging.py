@@ -448,6 +448,58 @@ class TestSecurityAuditTrail:
             f"Security indicators not found in logs: {log_output}"
 
 
+def test_snapshot_into_reuses_caller_dict():
+    """
+    MAJOR-006: Metric snapshots can be written into a reusable dict.
+    """
+    from reasoning_library.security_logging import SecurityLogger
+
+    security_logger = SecurityLogger("reasoning_library.security.snapshot_test")
+    security_logger.log_security_event("eval('attack')", source="snapshot_test")
+
+    out: Dict[str, Any] = {}
+    result = security_logger.snapshot_into(out)
+
+    assert result is out
+    assert out == security_logger.get_security_metrics()
+    assert out["total_events"] == 1
+    assert out["events_by_type"] == {"code_injection": 1}
+
+
+def test_events_by_type_counts_across_sources():
+    """
+    MAJOR-006: Per-type event counts aggregate over every source.
+    """
+    from reasoning_library.security_logging import SecurityLogger
+
+    security_logger = SecurityLogger("reasoning_library.security.count_test")
+    security_logger.log_security_event("eval('a')", source="source_a")
+    security_logger.log_security_event("eval('b')", source="source_b")
+    security_logger.log_security_event("<script>alert(1)</script>", source="source_a")
+
+    metrics = security_logger.get_security_metrics()
+
+    assert metrics["total_events"] == 3
+    assert metrics["events_by_type"] == {"code_injection": 2, "xss_attempt": 1}
+    assert metrics["active_sources"] == 2
+
+
+def test_event_counter_tracks_total_events():
+    """
+    MAJOR-006: The event counter matches total_events without a snapshot.
+    """
+    from reasoning_library.security_logging import SecurityLogger
+
+    security_logger = SecurityLogger("reasoning_library.security.counter_test")
+    assert security_logger.event_counter == 0
+
+    security_logger.log_security_event("eval('a')", source="counter_test")
+    security_logger.log_security_event("../../etc/passwd", source="counter_test")
+
+    assert security_logger.event_counter == 2
+    assert security_logger.event_counter == security_logger.get_security_metrics()["total_events"]
+
+
 def test_comprehensive_security_logging_summary():
     """
     MAJOR-006: Summary test to ensure comprehensive security logging coverage.
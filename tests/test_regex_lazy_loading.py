@@ -5,13 +5,49 @@ This test verifies that regex patterns are compiled lazily to improve
 module import performance and reduce startup overhead.
 """
 
+import gc
 import pytest
+import statistics
 import time
 import sys
 import importlib
 from unittest.mock import patch
 from typing import Dict
 
+# Backward-compatible pattern names served lazily by reasoning_library.core.__getattr__
+LAZY_PATTERN_NAMES = (
+    'FACTOR_PATTERN',
+    'COMMENT_PATTERN',
+    'EVIDENCE_PATTERN',
+    'COMBINATION_PATTERN',
+    'CLEAN_FACTOR_PATTERN',
+)
+
+# Fresh imports per timing; the median discards GC and filesystem-cache outliers
+IMPORT_TIMING_REPEATS = 7
+
+
+def _median_fresh_import_time(module_name: str, repeats: int = IMPORT_TIMING_REPEATS) -> float:
+    """
+    Median time in seconds of ``repeats`` fresh imports of ``module_name``.
+
+    The module is purged and finder caches are invalidated before each timed
+    import, and garbage collection is paused for the whole measurement.
+    """
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            sys.modules.pop(module_name, None)
+            importlib.invalidate_caches()
+            start = time.perf_counter_ns()
+            importlib.import_module(module_name)
+            timings.append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+    return statistics.median(timings) / 1e9
+
 def test_current_regex_compilation_timing():
     """
     Test current regex compilation timing to establish baseline.
@@ -26,24 +62,17 @@ def test_current_regex_compilation_timing():
 
     print(f"Module import time: {import_time:.4f} seconds")
 
-    # Verify that regex patterns are compiled at import time
-    assert hasattr(core_module, 'FACTOR_PATTERN'), "FACTOR_PATTERN should exist"
-    assert hasattr(core_module, 'COMMENT_PATTERN'), "COMMENT_PATTERN should exist"
-    assert hasattr(core_module, 'EVIDENCE_PATTERN'), "EVIDENCE_PATTERN should exist"
-    assert hasattr(core_module, 'COMBINATION_PATTERN'), "COMBINATION_PATTERN should exist"
-    assert hasattr(core_module, 'CLEAN_FACTOR_PATTERN'), "CLEAN_FACTOR_PATTERN should exist"
-
-    # Verify they are compiled regex objects
+    # Verify that regex patterns exist and are compiled regex objects. Each name
+    # is resolved once, so the module __getattr__ runs once per pattern
     import re
-    assert isinstance(core_module.FACTOR_PATTERN, re.Pattern), "FACTOR_PATTERN should be compiled"
-    assert isinstance(core_module.COMMENT_PATTERN, re.Pattern), "COMMENT_PATTERN should be compiled"
-    assert isinstance(core_module.EVIDENCE_PATTERN, re.Pattern), "EVIDENCE_PATTERN should be compiled"
-    assert isinstance(core_module.COMBINATION_PATTERN, re.Pattern), "COMBINATION_PATTERN should be compiled"
-    assert isinstance(core_module.CLEAN_FACTOR_PATTERN, re.Pattern), "CLEAN_FACTOR_PATTERN should be compiled"
+    for name in LAZY_PATTERN_NAMES:
+        pattern = getattr(core_module, name, None)
+        assert pattern is not None, f"{name} should exist"
+        assert isinstance(pattern, re.Pattern), f"{name} should be compiled"
 
     return {
         'import_time': import_time,
-        'patterns_compiled': 5
+        'patterns_compiled': len(LAZY_PATTERN_NAMES)
     }
 
 
@@ -153,15 +182,8 @@ def test_import_time_comparison():
     """
     Compare import times between eager and lazy loading approaches.
     """
-    # Test current eager loading
-    eager_start = time.perf_counter()
-
-    # Force reimport to measure fresh import time
-    if 'reasoning_library.core' in sys.modules:
-        del sys.modules['reasoning_library.core']
-
-    import reasoning_library.core
-    eager_time = time.perf_counter() - eager_start
+    # Test current eager loading with fresh reimports of the module
+    eager_time = _median_fresh_import_time('reasoning_library.core')
 
     print(f"Eager loading import time: {eager_time:.4f} seconds")
 
@@ -5,9 +5,26 @@ This test verifies that the consolidated sanitization logic works correctly
 and maintains backward compatibility with existing functionality.
 """
 
+import re
+
 import pytest
 
 from reasoning_library.sanitization import (
+    _CONCATENATION_BYPASS_SOURCES,
+    _LOG_INJECTION_DETECTOR_SOURCES,
+    _decode_encoded_characters,
+    _get_concatenation_injection_pattern,
+    _get_dangerous_keyword_pattern,
+    _get_log_injection_detector_pattern,
+    _get_log_injection_pattern,
+    _get_log_metadata_pattern,
+    _get_nested_injection_pattern,
+    _get_sensitive_data_pattern,
+    _get_template_injection_pattern,
+    _log_metadata_marker,
+    _may_contain_sensitive_data,
+    _normalize_unicode_for_security,
+    _sanitize_log_message_cached,
     sanitize_text_input,
     sanitize_for_concatenation,
     sanitize_for_display,
@@ -234,6 +251,181 @@ def test_performance_and_thread_safety():
     print("✓ Performance and thread safety verified")
 
 
+# Inputs for detector parity: benign text, the SEC-001 critical bypass vectors,
+# and at least one hit for each individual detector
+DETECTOR_PARITY_INPUTS = [
+    "plain text with nothing to see",
+    "password_reset_page",
+    "pass%77ord=secret123",
+    "api_%6bey=token456",
+    "passwor&#100;=secret",
+    "password=secret123&api_key=token456",
+    "import os",
+    "text with ${template} injection",
+    "eval(eval('x'))",
+    "'ev' + 'al'",
+    "'e' + 'v' + 'a' + 'l'",
+    "Error\n[INFO] Fake admin logged in",
+    "2024-01-01 12:00:00, fake entry",
+    "Jan 12 10:00:00 host sshd",
+    "[pid 1234] spoofed",
+    "[tid 99] spoofed",
+    "mail <root@example.com>",
+    "see http://example.com/path",
+]
+
+
+@pytest.mark.parametrize("text", DETECTOR_PARITY_INPUTS)
+def test_fused_detectors_match_individual_patterns(text):
+    """
+    Test that the fused detectors fire exactly when one of their parts does.
+    """
+    concatenation_parts = [
+        _get_dangerous_keyword_pattern(),
+        _get_template_injection_pattern(),
+        _get_nested_injection_pattern(),
+    ] + [re.compile(source, re.IGNORECASE) for source in _CONCATENATION_BYPASS_SOURCES]
+    expected = any(pattern.search(text) for pattern in concatenation_parts)
+    assert bool(_get_concatenation_injection_pattern().search(text)) == expected
+
+    log_parts = [_get_log_injection_pattern()] + [
+        re.compile(source, re.IGNORECASE) for _, source in _LOG_INJECTION_DETECTOR_SOURCES
+    ]
+    expected = any(pattern.search(text) for pattern in log_parts)
+    assert bool(_get_log_injection_detector_pattern().search(text)) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "password=secret123",
+    "API-KEY: abc",
+    "apikey=abc",
+    "Token='abc'",
+    "credentials=abc",
+    "\u017fecret=abc",          # long s matches 's' case-insensitively
+    "api_\u212aey=abc",          # Kelvin sign matches 'k'
+    "credent\u0131al=abc",       # dotless i matches 'i'
+    "CREDENT\u0130ALS=abc",      # dotted capital I matches 'i'
+])
+def test_sensitive_prefilter_never_skips_a_match(text):
+    """
+    Test that the sensitive data prefilter passes every text the pattern matches.
+    """
+    assert _get_sensitive_data_pattern().search(text)
+    assert _may_contain_sensitive_data(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("token=abc123, api_key=def456", "token=[REDACTED], api_key=[REDACTED]"),
+    ("password='hunter2' next", "password=[REDACTED] next"),
+    ("secret=,leading,commas x", "secret=[REDACTED],commas x"),  # value may start with a comma
+    ("password=ab'cd", "password=ab'cd"),   # quote not followed by a terminator
+])
+def test_sensitive_value_stops_at_terminator(text, expected):
+    """
+    Test that the masked value ends at the first terminator after its first character.
+    """
+    masked = _get_sensitive_data_pattern().sub(lambda m: f"{m.group(1)}=[REDACTED]", text)
+    assert masked == expected
+
+
+@pytest.mark.parametrize("text", [
+    "password_reset_page",
+    "tokenization_required",
+    "the secret ingredient",
+    "credentials expired",
+])
+def test_sensitive_prefilter_skips_text_without_separator(text):
+    """
+    Test that field names without a '=' or ':' separator skip the sensitive data regex.
+    """
+    assert not _get_sensitive_data_pattern().search(text)
+    assert not _may_contain_sensitive_data(text)
+
+
+def test_logging_cache_still_reports_repeated_injections(monkeypatch):
+    """
+    Test that cached log sanitization still emits a security event on every call.
+    """
+    events = []
+    monkeypatch.setattr(
+        "reasoning_library.sanitization.log_security_event",
+        lambda **kwargs: events.append(kwargs),
+    )
+    _sanitize_log_message_cached.cache_clear()
+
+    message = "Error\n[INFO] Fake admin logged in"
+    first = sanitize_for_logging(message, source="cache_test")
+    second = sanitize_for_logging(message, source="cache_test")
+
+    assert first == second == "Error [LOG_INJECTION_BLOCKED] Fake admin logged in"
+    assert _sanitize_log_message_cached.cache_info().hits == 1
+    assert len(events) == 2
+
+
+@pytest.mark.parametrize("message", [
+    "password=hunter2",
+    "api_key: abc123",
+    "pass%77ord=hunter2",           # field name only appears after URL decoding
+    "ｐａｓｓｗｏｒｄ＝hunter2",  # full-width field name and separator
+])
+def test_logging_cache_never_keeps_credentials(message):
+    """
+    Test that messages that may hold credentials are not kept as cache keys.
+    """
+    _sanitize_log_message_cached.cache_clear()
+
+    result = sanitize_for_logging(message)
+
+    assert "hunter2" not in result and "abc123" not in result
+    assert _sanitize_log_message_cached.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("\\x41\\102\\u0043\\U00000044", "ABCD"),   # every scheme in one level
+    ("\\x5c101", "A"),                            # decoded backslash starts a new escape
+    ("\\U0011ffff \\x41", "\\U0011ffff A"),       # out-of-range code point is kept
+])
+def test_backslash_escapes_decode_per_scheme(text, expected):
+    """
+    Test that the escape decoder handles mixed, layered and invalid escapes.
+    """
+    assert _decode_encoded_characters(text) == expected
+
+
+def test_deeply_nested_mixed_escapes_blocked():
+    """
+    Test that eight or more layers of mixed escapes are still fully unwrapped.
+    """
+    payload = r"\x5c134u005cU0000005cx5c134u005cU00000065val(1)"
+
+    assert _decode_encoded_characters(payload) == "[ENCODED_INJECTION_BLOCKED]"
+    assert sanitize_for_concatenation(payload) == ""
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("plain ascii text", "plain ascii text"),
+    ("ev\u200bal\ufeff", "eval"),                  # zero-width characters removed
+    ("line\u2028break\u2029end", "line break end"),  # separators become spaces
+    ("\u202eimport\u200f", "import"),               # directional overrides removed
+    ("\uff45\uff56\uff41\uff4c", "eval"),            # full-width folded by NFKC
+])
+def test_unicode_normalization_translate_table(text, expected):
+    """
+    Test that the translate-based Unicode normalization strips and folds as before.
+    """
+    assert _normalize_unicode_for_security(text) == expected
+
+
+def test_log_metadata_markers_in_one_pass():
+    """
+    Test that timestamps and process info each get their own marker from the fused pattern.
+    """
+    text = "at 2024-01-01 12:00:00 [pid 42] [tid 7] done"
+    assert _get_log_metadata_pattern().sub(_log_metadata_marker, text) == (
+        "at [TIMESTAMP_BLOCKED] [PROCESS_INFO_BLOCKED] [PROCESS_INFO_BLOCKED] done"
+    )
+
+
 if __name__ == "__main__":
     test_shared_sanitization_functionality()
     test_specialized_sanitization_functions()
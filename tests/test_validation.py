@@ -5,6 +5,8 @@ This module tests the validation functions for complex parameter types
 to ensure robust input validation and prevent type-related security vulnerabilities.
 """
 
+import math
+
 import pytest
 from typing import Any, Dict, List, Optional
 from reasoning_library.validation import (
@@ -12,6 +14,7 @@ from reasoning_library.validation import (
     validate_dict_schema,
     validate_hypothesis_dict,
     validate_confidence_value,
+    validate_confidence_value_batch,
     validate_hypotheses_list,
     validate_metadata_dict,
 )
@@ -224,11 +227,70 @@ class TestValidateConfidenceValue:
         result = validate_confidence_value(-0.5)
         assert result == 0.0
 
+    def test_in_range_numeric_returns_float(self):
+        """Test that in-range ints and floats come back as floats."""
+        for value in (0, 1, 0.0, 0.5, 1.0, True):
+            result = validate_confidence_value(value)
+            assert type(result) is float
+            assert result == float(value)
+
+    def test_negative_zero_normalized(self):
+        """Test that -0.0 comes back as positive 0.0."""
+        result = validate_confidence_value(-0.0)
+        assert math.copysign(1.0, result) == 1.0
+
+    def test_nan_and_infinite_floats_rejected(self):
+        """Test that NaN and infinite floats still raise ValidationError."""
+        with pytest.raises(ValidationError, match="cannot be NaN"):
+            validate_confidence_value(float("nan"))
+        with pytest.raises(ValidationError, match="cannot be infinite"):
+            validate_confidence_value(float("inf"))
+
     def test_invalid_confidence_type(self):
         """Test that invalid confidence types raise ValidationError."""
         with pytest.raises(ValidationError, match="Confidence value.*contains invalid characters"):
             validate_confidence_value("not_numeric")
 
+    @pytest.mark.parametrize(
+        "confidence",
+        ["nan", "NaN", "inf", "-Inf", "1e10", "+1E-3", "0xFF", "0b101", "0o17"],
+    )
+    def test_dangerous_notation_rejected(self, confidence):
+        """Test that special float and non-decimal notations are rejected."""
+        with pytest.raises(ValidationError, match="invalid format or dangerous content"):
+            validate_confidence_value(confidence)
+
+    @pytest.mark.parametrize(
+        "confidence, expected",
+        [("0.5", 0.5), (" .25 ", 0.25), ("5.", 1.0), ("-0.3", 0.0)],
+    )
+    def test_valid_decimal_string_confidence(self, confidence, expected):
+        """Test that plain decimal strings are accepted and clamped."""
+        assert validate_confidence_value(confidence) == expected
+
+
+class TestValidateConfidenceValueBatch:
+    """Test the validate_confidence_value_batch function."""
+
+    def test_mixed_batch(self):
+        """Test that valid values and failures are returned in input order."""
+        results = validate_confidence_value_batch([0.5, "0.25", "NaN", None, 2])
+
+        assert results[0] == 0.5
+        assert results[1] == 0.25
+        assert isinstance(results[2], ValidationError)
+        assert isinstance(results[3], ValidationError)
+        assert results[4] == 1.0
+
+    def test_empty_batch(self):
+        """Test that an empty batch yields no results."""
+        assert validate_confidence_value_batch([]) == []
+
+    def test_non_list_input(self):
+        """Test that a non-list batch raises ValidationError."""
+        with pytest.raises(ValidationError, match="must be a list"):
+            validate_confidence_value_batch("0.5")
+
 
 class TestValidateHypothesesList:
     """Test the validate_hypotheses_list function."""